@@ -1,19 +1,29 @@
 """Sphinx configuration for lifegraph documentation."""
 
 import os
+import re
 import sys
 
 # -- Path setup --------------------------------------------------------------
 sys.path.insert(0, os.path.abspath(".."))
 
-import lifegraph
+# The gallery only writes image files; never load a GUI backend.
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+
+def _read_version():
+    """Read ``__version__`` without importing lifegraph (and matplotlib)."""
+    init = os.path.join(os.path.dirname(__file__), "..", "lifegraph", "__init__.py")
+    with open(init) as f:
+        return re.search(r'^__version__ = "([^"]+)"', f.read(), re.M).group(1)
+
 
 # -- Project information -----------------------------------------------------
 project = "lifegraph"
 copyright = "2024, Kyle Shores"
 author = "Kyle Shores"
-version = lifegraph.__version__
-release = lifegraph.__version__
+version = _read_version()
+release = version
 
 # -- General configuration ---------------------------------------------------
 extensions = [
@@ -58,7 +68,7 @@ sphinx_gallery_conf = {
     "examples_dirs": ["../examples"],
     "gallery_dirs": ["auto_examples"],
     "filename_pattern": r"/plot_",
-    "ignore_pattern": r"(all_sizes|__init__)\.py",
+    "ignore_pattern": r"(all_sizes|__init__)\.py$",
     "subsection_order": ExplicitOrder(
         [
             "../examples/getting_started",
@@ -71,15 +81,24 @@ sphinx_gallery_conf = {
     "within_subsection_order": FileNameSortKey,
     "thumbnail_size": (400, 400),
     "show_signature": False,
+    # Execute examples in parallel using the same job count as ``sphinx-build -j``.
+    "parallel": True,
 }
 
 
+# Resolution used when rendering gallery images.  The examples ask for
+# print-quality DPI, but the gallery only needs screen-sized images.
+_GALLERY_DPI = int(os.environ.get("LIFEGRAPH_DOC_DPI", "100"))
+
+
 def _reset_matplotlib_with_tight_bbox(gallery_conf, fname):  # noqa: ARG001
     """Reset matplotlib but keep savefig.bbox='tight'.
 
     sphinx-gallery's default reset calls ``plt.rcdefaults()`` which clears
     all custom rcParams.  Lifegraph annotations often extend beyond the axes,
     so we need ``bbox_inches='tight'`` on every scraper save to avoid clipping.
+    ``savefig.dpi`` is lowered as well; lifegraph only sets ``figure.dpi``,
+    so this caps the resolution of every saved and scraped image.
     """
     import importlib
     import matplotlib as mpl
@@ -90,6 +109,7 @@ def _reset_matplotlib_with_tight_bbox(gallery_conf, fname):  # noqa: ARG001
     importlib.reload(mpl.dates)
     importlib.reload(mpl.category)
     mpl.rcParams["savefig.bbox"] = "tight"
+    mpl.rcParams["savefig.dpi"] = _GALLERY_DPI
 
 
 sphinx_gallery_conf["reset_modules"] = (_reset_matplotlib_with_tight_bbox, "seaborn")
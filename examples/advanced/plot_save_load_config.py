@@ -24,7 +24,20 @@ g.add_title("My Life")
 g.save_config("my_life.json")
 
 # %%
-# Re-import and render from the saved config.
+# The same configuration is also available as a plain dictionary, which is
+# handy for storing it somewhere other than a file.
 
-g2 = Lifegraph.from_config("my_life.json")
+config = g.to_dict()
+print("Number of events:", len(config["events"]))
+print("First event:", config["events"][0])
+
+# %%
+# Loading the saved file gives back the same configuration.
+
+print(Lifegraph.from_config("my_life.json").to_dict() == config)
+
+# %%
+# Recreate the graph from the dictionary and render it.
+
+g2 = Lifegraph.from_dict(config)
 g2.save("my_life.png")
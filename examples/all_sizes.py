@@ -2,11 +2,19 @@ from lifegraph.lifegraph import Lifegraph, Papersize, Point, Side
 from datetime import date
 from pathlib import Path
 
+import matplotlib
+
+# this script only writes files, so skip loading an interactive backend
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt  # noqa: E402
+
 IMAGES_DIR = Path(__file__).parent / "images"
 
 def main(path=None):
     birthday = date(1990, 11, 1)
-    image_path = str(Path(__file__).parent / "couple.jpg")
+    # decode the background once and share it across every paper size
+    image = plt.imread(str(Path(__file__).parent / "couple.jpg"))
+    out_dir = Path(path) if path else IMAGES_DIR
 
     for sz in Papersize:
         print(f"{sz}")
@@ -27,12 +35,11 @@ def main(path=None):
 
         g.add_title("Our Life, Together")
 
-        g.add_image(image_path, alpha=0.3)
+        g.add_image(image, alpha=0.3)
 
         g.show_max_age_label()
 
-        output = Path(path) / f"lifegraph_{sz.name}.png" if path else IMAGES_DIR / f"lifegraph_{sz.name}.png"
-        g.save(str(output))
+        g.save(str(out_dir / f"lifegraph_{sz.name}.png"))
         g.close()
 
 if __name__ == '__main__':
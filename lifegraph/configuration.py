@@ -1,5 +1,7 @@
 from enum import Enum
+import functools
 from pathlib import Path
+from types import MappingProxyType
 
 import matplotlib
 
@@ -14,10 +16,15 @@ def _clamp(val, lo, hi):
     return max(lo, min(hi, val))
 
 
+@functools.lru_cache(maxsize=1)
 def _load_base_style():
-    """Read the bundled ``.mplstyle`` file and return it as a dict."""
+    """Read the bundled ``.mplstyle`` file and return it as a read-only mapping.
+
+    The file is parsed once per process; callers copy the result before
+    modifying it.
+    """
     rc = matplotlib.rc_params_from_file(str(STYLE_PATH), use_default_template=False)
-    return dict(rc)
+    return MappingProxyType(dict(rc))
 
 
 class Papersize(Enum):
@@ -56,6 +63,62 @@ class Papersize(Enum):
     Ledger = (11.0, 17.0)
     Tabloid = (17.0, 11.0)
 
+    def __init__(self, width, height):
+        # figure size and scale factor relative to A3, fixed per member
+        self._figsize = (width, height)
+        self._scale = (width**2 + height**2) ** 0.5 / _A3_DIAG
+
+
+@functools.lru_cache(maxsize=None)
+def _scaled_params(papersize):
+    """Compute the ``(rcParams, otherParams)`` table entry for *papersize*.
+
+    The result depends only on the enum member, so it is computed once per
+    size and returned as read-only mappings; :class:`LifegraphParams` copies
+    them before use.
+    """
+    s = papersize._scale
+
+    rc = dict(_load_base_style())
+    rc.update(
+        {
+            "figure.figsize": papersize._figsize,
+            "axes.labelsize": _clamp(round(16 * s), 1, 40),
+            "figure.titlesize": _clamp(round(28 * s), 4, 128),
+            "font.size": _clamp(round(18 * s), 1, 60),
+            "lines.linewidth": round(max(0.2, 0.5 * s), 2),
+            "lines.markersize": round(max(0.5, 4.5 * s), 2),
+            "lines.markeredgewidth": round(max(0.01, 0.50 * s), 2),
+            "xtick.labelsize": _clamp(round(10 * s), 1, 20),
+            "ytick.labelsize": _clamp(round(10 * s), 1, 20),
+            "savefig.pad_inches": (
+                0.50 if s > 0.8 else (0.25 if s > 0.4 else 0.05)
+            ),
+        }
+    )
+
+    other = {
+        "xlabel.position": (0.20, 1.05),
+        "xlabel.color": None,
+        "xlabel.fontsize": None,
+        "ylabel.position": (-0.03, 0.95),
+        "ylabel.color": None,
+        "ylabel.fontsize": None,
+        "maxage.fontsize": _clamp(round(20 * s), 2, 38),
+        "figure.title.yposition": 0.95 if s > 0.3 else 0.97,
+        "annotation.marker.size": round(max(0.001, 8.0 * s), 2),
+        "annotation.edge.width": round(max(0.1, 0.8 * s), 2),
+        "annotation.line.width": round(max(0.1, 1.0 * s), 2),
+        "annotation.shrinkA": 0,
+        "annotation.left.offset": 6 if s < 1.5 else 3,
+        "annotation.right.offset": 5 if s < 1.5 else 3,
+        "era.span.linestyle": "-",
+        "era.span.markersize": 0,
+        "era.line.linewidth": round(max(0.2, 1.0 * s), 2),
+        "watermark.fontsize": _clamp(round(120 * s), 18, 200),
+    }
+    return MappingProxyType(rc), MappingProxyType(other)
+
 
 class LifegraphParams:
     """Drawing parameters scaled to a particular paper size.
@@ -85,47 +148,11 @@ class LifegraphParams:
     >>> params.rcParams["figure.figsize"]
     [8.3, 11.7]
     """
+    __slots__ = ("size", "rcParams", "otherParams")
 
     def __init__(self, papersize):
         self.size = papersize
-        w, h = papersize.value
-        s = (w**2 + h**2) ** 0.5 / _A3_DIAG
-
-        self.rcParams = _load_base_style()
-        self.rcParams.update(
-            {
-                "figure.figsize": [w, h],
-                "axes.labelsize": _clamp(round(16 * s), 1, 40),
-                "figure.titlesize": _clamp(round(28 * s), 4, 128),
-                "font.size": _clamp(round(18 * s), 1, 60),
-                "lines.linewidth": round(max(0.2, 0.5 * s), 2),
-                "lines.markersize": round(max(0.5, 4.5 * s), 2),
-                "lines.markeredgewidth": round(max(0.01, 0.50 * s), 2),
-                "xtick.labelsize": _clamp(round(10 * s), 1, 20),
-                "ytick.labelsize": _clamp(round(10 * s), 1, 20),
-                "savefig.pad_inches": (
-                    0.50 if s > 0.8 else (0.25 if s > 0.4 else 0.05)
-                ),
-            }
-        )
-
-        self.otherParams = {
-            "xlabel.position": (0.20, 1.05),
-            "xlabel.color": None,
-            "xlabel.fontsize": None,
-            "ylabel.position": (-0.03, 0.95),
-            "ylabel.color": None,
-            "ylabel.fontsize": None,
-            "maxage.fontsize": _clamp(round(20 * s), 2, 38),
-            "figure.title.yposition": 0.95 if s > 0.3 else 0.97,
-            "annotation.marker.size": round(max(0.001, 8.0 * s), 2),
-            "annotation.edge.width": round(max(0.1, 0.8 * s), 2),
-            "annotation.line.width": round(max(0.1, 1.0 * s), 2),
-            "annotation.shrinkA": 0,
-            "annotation.left.offset": 6 if s < 1.5 else 3,
-            "annotation.right.offset": 5 if s < 1.5 else 3,
-            "era.span.linestyle": "-",
-            "era.span.markersize": 0,
-            "era.line.linewidth": round(max(0.2, 1.0 * s), 2),
-            "watermark.fontsize": _clamp(round(120 * s), 18, 200),
-        }
+        rc, other = _scaled_params(papersize)
+        self.rcParams = dict(rc)
+        self.rcParams["figure.figsize"] = list(rc["figure.figsize"])
+        self.otherParams = dict(other)
@@ -1,4 +1,12 @@
 from enum import Enum
+import sys
+
+from matplotlib.transforms import Bbox
+import numpy as np
+
+def _intern(value):
+    """Intern string style values so repeated colors share one object."""
+    return sys.intern(value) if isinstance(value, str) else value
 
 class Side(Enum):
     """Specify which side of the plot to place an annotation.
@@ -33,6 +41,7 @@ class Point:
     >>> p.x
     10
     """
+    __slots__ = ("x", "y")
     def __init__(self, x, y):
         self.x = x
         self.y = y
@@ -64,6 +73,7 @@ class DatePosition(Point):
     >>> dp.date
     datetime.date(1995, 3, 1)
     """
+    __slots__ = ("date",)
     def __init__(self, x, y, date):
         super().__init__(x, y)
         self.date = date
@@ -95,16 +105,28 @@ class Marker(Point):
     >>> from lifegraph.core import Marker
     >>> m = Marker(5, 10, color='red')
     """
+    __slots__ = ("marker", "fillstyle", "color")
     def __init__(self, x, y, marker='s', fillstyle='none', color='black'):
         super().__init__(x, y)
-        self.marker = marker
-        self.fillstyle = fillstyle
-        self.color = color
+        self.marker = _intern(marker)
+        self.fillstyle = _intern(fillstyle)
+        self.color = _intern(color)
     def __repr__(self):
         return f"Marker at {super().__repr__()}"
     def __str__(self):
         return f"Marker at {super().__repr__()}"
 
+def _corners_of(that):
+    """Return the bbox corners of *that*, raising ValueError if it is not an Annotation.
+
+    Only objects with corners reach the geometry, so a failed attribute
+    lookup stands in for an ``isinstance`` check on every call.
+    """
+    try:
+        return that._corners
+    except AttributeError:
+        raise ValueError("Argument for intersects should be an annotation") from None
+
 class Annotation(Point):
     """A text annotation with layout-conflict resolution support.
 
@@ -122,7 +144,9 @@ class Annotation(Point):
     color : str or tuple, optional
         A matplotlib color. Default is ``'black'``.
     bbox : matplotlib.transforms.Bbox or None, optional
-        The bounding box of the rendered text. Set after layout.
+        The bounding box of the rendered text. Set after layout.  The
+        extents are stored as a 4-float array; :attr:`bbox` is a ``Bbox``
+        view onto that array.
     event_point : Point or None, optional
         Where on the grid the event is located.
     put_circle_around_point : bool, optional
@@ -141,12 +165,14 @@ class Annotation(Point):
         outside the visible ``[min_age, max_age)`` window.
         Default is ``None`` (always visible).
     """
+    __slots__ = ("date", "text", "color", "event_point", "put_circle_around_point", "marker", "relpos",
+                 "source_y_range", "_corners", "_bbox")
     def __init__(self, date, text, label_point, color='black', bbox=None, event_point=None, put_circle_around_point=True, marker=None, relpos=(.5, .5), source_y_range=None):
         super().__init__(label_point.x, label_point.y)
         self.date = date
         self.text = text
-        self.color = color
-        self.bbox = bbox
+        self.color = _intern(color)
+        self.set_bbox(bbox)
         self.event_point = event_point
         self.put_circle_around_point = put_circle_around_point
         self.marker = marker
@@ -157,10 +183,35 @@ class Annotation(Point):
 
         Parameters
         ----------
-        bbox : matplotlib.transforms.Bbox
+        bbox : matplotlib.transforms.Bbox or None
             The bounding box in data coordinates.
+
+        Notes
+        -----
+        The extents are copied into a ``[xmin, ymin, xmax, ymax]`` array and
+        :attr:`bbox` becomes a normalized ``Bbox`` sharing that memory, so
+        edits made through either one are seen by the other.
         """
-        self.bbox = bbox
+        if bbox is None:
+            self._corners = None
+            self._bbox = None
+        else:
+            self._corners = np.array([bbox.xmin, bbox.ymin, bbox.xmax, bbox.ymax], dtype=np.float64)
+            self._bbox = Bbox(self._corners.reshape(2, 2))
+    @property
+    def bbox(self):
+        """matplotlib.transforms.Bbox or None: The label bounding box in data coordinates."""
+        return self._bbox
+    @bbox.setter
+    def bbox(self, bbox):
+        self.set_bbox(bbox)
+    @property
+    def extents(self):
+        """tuple of float or None: The ``(xmin, xmax, ymin, ymax)`` of :attr:`bbox`."""
+        if self._corners is None:
+            return None
+        xmin, ymin, xmax, ymax = self._corners.tolist()
+        return (xmin, xmax, ymin, ymax)
     def set_relpos(self, relpos):
         """Set the arrow origin relative to the label bounding box.
 
@@ -193,13 +244,9 @@ class Annotation(Point):
         ValueError
             If *that* is not an :class:`Annotation`.
         """
-        if (not isinstance(that, Annotation)):
-            raise ValueError("Argument for intersects should be an annotation")
-        if (self.bbox.xmin >= that.bbox.xmax or that.bbox.xmin >= self.bbox.xmax):
-            return False
-        if (self.bbox.ymin >= that.bbox.ymax or that.bbox.ymin >= self.bbox.ymax):
-            return False
-        return True
+        txmin, tymin, txmax, tymax = _corners_of(that)
+        sxmin, symin, sxmax, symax = self._corners
+        return not ((sxmin >= txmax) | (txmin >= sxmax) | (symin >= tymax) | (tymin >= symax))
     def is_within_epsilon_of(self, that, epsilon):
         """Check whether two annotations are closer than a tolerance.
 
@@ -220,13 +267,10 @@ class Annotation(Point):
         ValueError
             If *that* is not an :class:`Annotation`.
         """
-        if (not isinstance(that, Annotation)):
-            raise ValueError("Argument for intersects should be an annotation")
-        if (self.bbox.xmin - epsilon > that.bbox.xmax or that.bbox.xmin - epsilon > self.bbox.xmax):
-            return False
-        if (self.bbox.ymin - epsilon > that.bbox.ymax or that.bbox.ymin - epsilon > self.bbox.ymax):
-            return False
-        return True
+        txmin, tymin, txmax, tymax = _corners_of(that)
+        sxmin, symin, sxmax, symax = self._corners
+        return not ((sxmin - epsilon > txmax) | (txmin - epsilon > sxmax)
+                    | (symin - epsilon > tymax) | (tymin - epsilon > symax))
     def get_bbox_overlap(self, that, epsilon):
         """Compute the overlap dimensions between two annotation bounding boxes.
 
@@ -240,19 +284,16 @@ class Annotation(Point):
         Returns
         -------
         tuple of float
-            ``(width, height)`` of the overlap region.
+            ``(width, height)`` where *width* is the horizontal overlap and
+            *height* is the vertical distance from the top of this box to
+            the bottom of *that*, plus *epsilon*.
 
         Raises
         ------
         ValueError
             If *that* is not an :class:`Annotation`.
         """
-        if (not isinstance(that, Annotation)):
-            raise ValueError("Argument for intersects should be an annotation")
-        width = min(self.bbox.xmax, that.bbox.xmax) - max(self.bbox.xmin, that.bbox.xmin)
-        height = min(self.bbox.ymax, that.bbox.ymax) - max(self.bbox.ymin, that.bbox.ymin)
-        height = abs(that.bbox.ymax - self.bbox.ymin) + epsilon
-        return (width, height)
+        return self._overlap_and_correction(that, epsilon)[:2]
     def get_xy_correction(self, that, epsilon):
         """Compute the correction needed to resolve an overlap.
 
@@ -273,11 +314,13 @@ class Annotation(Point):
         ValueError
             If *that* is not an :class:`Annotation`.
         """
-        if (not isinstance(that, Annotation)):
-            raise ValueError("Argument for intersects should be an annotation")
-        width = abs(that.bbox.xmax - self.bbox.xmin) + epsilon
-        height = abs(that.bbox.ymax - self.bbox.ymin) + epsilon
-        return (width, height)
+        return self._overlap_and_correction(that, epsilon)[2:]
+    def _overlap_and_correction(self, that, epsilon):
+        """Return ``(overlap_width, overlap_height, dx, dy)`` reading each extent once."""
+        txmin, _, txmax, tymax = _corners_of(that)
+        sxmin, symin, sxmax, _ = self._corners
+        dy = abs(tymax - symin) + epsilon
+        return (min(sxmax, txmax) - max(sxmin, txmin), dy, abs(txmax - sxmin) + epsilon, dy)
     def update_X_with_correction(self, correction):
         """Shift the label in the x direction.
 
@@ -287,8 +330,21 @@ class Annotation(Point):
             ``correction[0]`` is added to the x position and bounding box.
         """
         self.x += correction[0]
-        self.bbox.x0 += correction[0]
-        self.bbox.x1 += correction[0]
+        self._corners[::2] += correction[0]
+        self._bbox.invalidate()
+    def set_x(self, x):
+        """Move the label so that it, and its bounding box, start at *x*.
+
+        Parameters
+        ----------
+        x : float
+            New left edge in data coordinates.
+        """
+        width = self._corners[2] - self._corners[0]
+        self.x = x
+        self._corners[0] = x
+        self._corners[2] = x + width
+        self._bbox.invalidate()
     def update_Y_with_correction(self, correction):
         """Shift the label in the y direction.
 
@@ -298,13 +354,110 @@ class Annotation(Point):
             ``correction[1]`` is added to the y position and bounding box.
         """
         self.y += correction[1]
-        self.bbox.y0 += correction[1]
-        self.bbox.y1 += correction[1]
+        self._corners[1::2] += correction[1]
+        self._bbox.invalidate()
     def __repr__(self):
         return f"Annotation '{self.text}' at {super().__repr__()}"
     def __str__(self):
         return f"Annotation '{self.text}' at {super().__repr__()}"
 
+class AnnotationBatch:
+    """The bounding boxes of a group of annotations as parallel arrays.
+
+    Used by :class:`~lifegraph.lifegraph.Lifegraph` to resolve label
+    conflicts.  Each label is tested against all previously placed labels
+    with one vectorized comparison instead of one :meth:`Annotation.overlaps`
+    call per pair.
+
+    Parameters
+    ----------
+    annotations : list of Annotation
+        Annotations whose bounding boxes have been set, in placement order.
+
+    Attributes
+    ----------
+    xmin, xmax, ymin, ymax : numpy.ndarray
+        Bounding-box extents in data coordinates, one entry per annotation.
+    """
+    __slots__ = ("annotations", "xmin", "ymin", "xmax", "ymax")
+    def __init__(self, annotations):
+        self.annotations = list(annotations)
+        corners = np.array([a._corners for a in self.annotations], dtype=np.float64).reshape(-1, 4)
+        self.xmin, self.ymin, self.xmax, self.ymax = corners.T.copy()
+    def __len__(self):
+        return len(self.annotations)
+    def overlaps(self, i, others):
+        """Test whether annotation *i* overlaps each of *others*.
+
+        Parameters
+        ----------
+        i : int
+            Index of the annotation to test.
+        others : int, slice, or array of int
+            Indices of the annotations to test against.
+
+        Returns
+        -------
+        numpy.ndarray of bool
+            Same semantics as :meth:`Annotation.overlaps`, element-wise.
+        """
+        return ~((self.xmin[i] >= self.xmax[others]) | (self.xmin[others] >= self.xmax[i])
+                 | (self.ymin[i] >= self.ymax[others]) | (self.ymin[others] >= self.ymax[i]))
+    def is_within_epsilon_of(self, i, others, epsilon):
+        """Test whether annotation *i* is within *epsilon* of each of *others*.
+
+        Parameters
+        ----------
+        i : int
+            Index of the annotation to test.
+        others : int, slice, or array of int
+            Indices of the annotations to test against.
+        epsilon : float
+            Minimum allowed distance between bounding boxes.
+
+        Returns
+        -------
+        numpy.ndarray of bool
+            Same semantics as :meth:`Annotation.is_within_epsilon_of`,
+            element-wise.
+        """
+        return ~((self.xmin[i] - epsilon > self.xmax[others]) | (self.xmin[others] - epsilon > self.xmax[i])
+                 | (self.ymin[i] - epsilon > self.ymax[others]) | (self.ymin[others] - epsilon > self.ymax[i]))
+    def update_Y_with_correction(self, i, dy):
+        """Shift annotation *i* (and its stored extents) by *dy* in y."""
+        self.ymin[i] += dy
+        self.ymax[i] += dy
+        self.annotations[i].update_Y_with_correction((0, dy))
+    def resolve_conflicts(self, epsilon):
+        """Move labels down so that none collides with an earlier label.
+
+        Labels are placed in order.  Each label is compared with every
+        earlier label in turn: if they overlap it is moved below that label
+        plus *epsilon*, and if it is then still within *epsilon* it is moved
+        down by another *epsilon*.  Labels that cannot collide are skipped
+        with a single vectorized test, so only the pairs that actually need
+        a correction are visited one at a time.
+
+        Parameters
+        ----------
+        epsilon : float
+            Gap to keep between labels.
+        """
+        for i in range(1, len(self)):
+            k = 0
+            while k < i:
+                # within-epsilon is a superset of overlapping, so the next pair
+                # that needs any correction is the first within-epsilon hit
+                hits = np.flatnonzero(self.is_within_epsilon_of(i, slice(k, i), epsilon))
+                if hits.size == 0:
+                    break
+                k += hits[0]
+                if self.overlaps(i, k):
+                    self.update_Y_with_correction(i, abs(self.ymax[k] - self.ymin[i]) + epsilon)
+                if self.is_within_epsilon_of(i, k, epsilon):
+                    self.update_Y_with_correction(i, epsilon)
+                k += 1
+
 class Era():
     """A highlighted region on the grid representing a period of time.
 
@@ -331,11 +484,12 @@ class Era():
     >>> g = Lifegraph(date(1990, 1, 1))
     >>> g.add_era("College", date(2008, 9, 1), date(2012, 5, 15), color="blue")
     """
+    __slots__ = ("text", "start", "end", "color", "alpha")
     def __init__(self, text, start, end, color, alpha=1):
         self.text = text
         self.start = start
         self.end = end
-        self.color = color
+        self.color = _intern(color)
         self.alpha = alpha
     def __repr__(self):
         return f"Era '{self.text}' starting at {self.start}, ending at {self.end}"
@@ -371,6 +525,7 @@ class EraSpan(Era):
     >>> g.add_era_span("Grad school", date(2012, 9, 1), date(2016, 5, 15),
     ...               color="#4423fe")
     """
+    __slots__ = ("start_marker", "end_marker")
     def __init__(self, text, start, end, color, start_marker=None, end_marker=None):
         super().__init__(text, start, end, color)
         self.start_marker = start_marker
@@ -1,18 +1,121 @@
 from dateutil.relativedelta import relativedelta
 import datetime
+import functools
 import io
-import matplotlib.image as mpimg
-import matplotlib.lines as mlines
-from matplotlib.transforms import Bbox
-import matplotlib.pyplot as plt
+import matplotlib
+import matplotlib.colors as mcolors
+from matplotlib.transforms import Bbox, IdentityTransform
 import numpy as np
 
 from lifegraph.configuration import LifegraphParams, Papersize
-from lifegraph.core import Point, DatePosition, Marker, Annotation, Era, EraSpan, Side
+from lifegraph.core import Point, DatePosition, Marker, Annotation, AnnotationBatch, Era, EraSpan, Side
 from lifegraph import serialization
 from lifegraph.utils import random_color
 
 
+# The tick positions and grid points depend only on the grid dimensions, so they are
+# computed once per shape and shared by every graph of that shape. Callers must not
+# modify the results.
+
+@functools.lru_cache(maxsize=32)
+def _xticks(xmax):
+    """Week tick positions: 1, then every fifth week up to *xmax*."""
+    return (1, *range(5, xmax+1, 5))
+
+
+@functools.lru_cache(maxsize=32)
+def _yticks(min_age, max_age):
+    """Age tick positions: every multiple of 5 in ``[min_age, max_age)``, led by *min_age*."""
+    # Start from the first multiple of 5 >= min_age
+    first_tick_5 = min_age + (5 - min_age % 5) % 5
+    lead = (min_age,) if min_age % 5 != 0 else ()
+    return (*lead, *range(first_tick_5, max_age, 5))
+
+
+@functools.lru_cache(maxsize=32)
+def _grid_points(xmax, min_age, max_age):
+    """The ``(x, y)`` arrays of every grid square, as read-only arrays."""
+    xs, ys = np.meshgrid(np.arange(1, xmax+1), np.arange(min_age, max_age))
+    xs, ys = xs.ravel(), ys.ravel()
+    xs.flags.writeable = False
+    ys.flags.writeable = False
+    return xs, ys
+
+
+# Dates map to grid cells through the birthdate alone, so the mapping is shared by every
+# graph with that birthdate. Eras and spans often start or end on an event's date.
+
+@functools.lru_cache(maxsize=256)
+def _start_of_year(birthdate, year):
+    """The birthday that starts the given year of life."""
+    return birthdate + relativedelta(years=year)
+
+
+@functools.lru_cache(maxsize=4096)
+def _date_to_xy(birthdate, date, xmax):
+    """The ``(week, year)`` grid cell of *date* for a life starting on *birthdate*."""
+    year = date.year - birthdate.year - ((date.month, date.day) < (birthdate.month, birthdate.day))
+    # a February 29th birthday falls on February 28th in common years, as with relativedelta
+    if date >= _start_of_year(birthdate, year + 1):
+        year += 1
+    # Assume the start of the year for each year of your life is your birthdate
+    # something that happens within or up to (not including) 7 days after the start
+    # of the year happens in the first week of your life that year
+    # Using this logic, your birthday will always happen on week 1 of each year
+    week = (date - _start_of_year(birthdate, year)).days // 7
+    return week % xmax + 1, year
+
+
+# Layout boxes of label texts in display units, relative to the text anchor. Measuring text
+# needs a renderer pass, so each label is measured once per font, dpi and renderer type.
+# The cache is keyed first by that measuring context and then by the text itself.
+_LABEL_LAYOUT_CACHE_SIZE = 4096
+_LABEL_LAYOUT_CONTEXTS = 32
+_label_layouts = {}
+
+
+def _label_layout(text, figure, renderer):
+    """Return the display-unit box of a bold ``ha='left', va='center'`` label anchored at (0, 0).
+
+    Translating the result by the display position of the anchor gives exactly what
+    ``get_window_extent`` returns for the same text drawn at that anchor.
+    """
+    return _label_layouts_for((text,), figure, renderer)[0]
+
+
+def _label_layouts_for(texts, figure, renderer):
+    """Return the :func:`_label_layout` box of each of ``texts``.
+
+    The measuring context is hashed once for the whole batch, so a label that was
+    measured on an earlier draw costs a single dict lookup.
+    """
+    from matplotlib.font_manager import FontProperties
+    from matplotlib.text import Text
+
+    fontproperties = FontProperties(weight='bold')
+    rc = matplotlib.rcParams
+    context = (fontproperties, figure.dpi, renderer.dpi, type(renderer),
+               rc["text.usetex"], rc["text.hinting"], rc["text.hinting_factor"], rc["mathtext.fontset"])
+    cache = _label_layouts.get(context)
+    if cache is None:
+        if len(_label_layouts) >= _LABEL_LAYOUT_CONTEXTS:
+            _label_layouts.clear()
+        cache = _label_layouts[context] = {}
+    layouts = []
+    for text in texts:
+        layout = cache.get(text)
+        if layout is None:
+            t = Text(0, 0, text, ha='left', va='center', fontproperties=fontproperties,
+                     transform=IdentityTransform())
+            t.set_figure(figure)
+            layout = t.get_window_extent(renderer=renderer).frozen()
+            if len(cache) >= _LABEL_LAYOUT_CACHE_SIZE:
+                cache.clear()
+            cache[text] = layout
+        layouts.append(layout)
+    return layouts
+
+
 class Lifegraph:
     """Visualize a life as a grid of weekly squares.
 
@@ -80,7 +183,10 @@ class Lifegraph:
         self.settings.rcParams["figure.dpi"] = dpi
         self.axes_rect = axes_rect if axes_rect is not None else [.25, .1, .5, .8]
 
+        self.fig = None
         self.renderer = None
+        # set by every method that changes what is drawn, cleared by __draw
+        self._dirty = True
 
         # the data limits, we want a grid of 52 weeks by max_age years
         # negative minimum so that the squares are not cut off
@@ -89,6 +195,8 @@ class Lifegraph:
         self.min_age = min_age
         self.ymin = min_age - .5
         self.ymax = max_age
+        # the last valid event date, fixed by the birthdate and max_age
+        self._max_date = birthdate + relativedelta(years=max_age)
 
         self.xlims = [self.xmin, self.xmax]
         self.ylims = [self.ymin, self.ymax]
@@ -98,6 +206,7 @@ class Lifegraph:
         self.title = None
 
         self.image_name = None
+        self.image_data = None
         self.image_alpha = 1
 
         self.xaxis_label = r'Week of the Year $\longrightarrow$'
@@ -157,6 +266,8 @@ class Lifegraph:
         if fontsize is not None:
             self.settings.otherParams["xlabel.fontsize"] = fontsize
 
+        self._dirty = True
+
     def format_y_axis(self, text=None, positionx=None, positiony=None, color=None, fontsize=None):
         """Customise the y-axis label appearance.
 
@@ -195,6 +306,8 @@ class Lifegraph:
         if fontsize is not None:
             self.settings.otherParams["ylabel.fontsize"] = fontsize
 
+        self._dirty = True
+
     def show_max_age_label(self):
         """Display the maximum age number at the bottom-right of the grid.
 
@@ -204,6 +317,7 @@ class Lifegraph:
         >>> g.show_max_age_label()
         """
         self.draw_max_age = True
+        self._dirty = True
 
     def add_life_event(self, text, date, color=None, hint=None, side=None, color_square=True):
         """Add a labeled event to the graph.
@@ -244,17 +358,51 @@ class Lifegraph:
         >>> g.add_life_event("Moved abroad", date(2015, 3, 1), side=Side.LEFT)
         """
         self.__validate_date(date)
+        self.__append_life_events([
+            self.__make_life_event(text, date, self.__to_date_position(date), color, hint, side, color_square)])
+
+    def add_life_events(self, events):
+        """Add many labeled events to the graph at once.
 
-        position = self.__to_date_position(date)
+        Equivalent to calling :meth:`add_life_event` for every item, but the
+        grid positions of all dates are computed in a single vectorized pass,
+        which is noticeably faster for hundreds of events.  Every event is
+        validated before any of them is added.
 
+        Parameters
+        ----------
+        events : iterable of dict
+            Each dict holds the keyword arguments of :meth:`add_life_event`;
+            ``text`` and ``date`` are required.
+
+        Raises
+        ------
+        ValueError
+            If any date is outside the range ``[birthdate, birthdate + max_age)``,
+            or an event gives both *hint* and *side*.  No event is added then.
+
+        Examples
+        --------
+        >>> g.add_life_events([
+        ...     {"text": "Graduated", "date": date(2012, 5, 20), "color": "#00FF00"},
+        ...     {"text": "Moved abroad", "date": date(2015, 3, 1), "side": Side.LEFT},
+        ... ])
+        """
+        events = list(events)
+        dates = [ev["date"] for ev in events]
+        self.__validate_dates(dates)
+
+        # build every event before adding any, so a bad record leaves the graph unchanged
+        self.__append_life_events([
+            self.__make_life_event(ev["text"], ev["date"], position, ev.get("color"), ev.get("hint"),
+                                   ev.get("side"), ev.get("color_square", True))
+            for ev, position in zip(events, self.__to_date_positions(dates))])
+
+    def __make_life_event(self, text, date, position, color, hint, side, color_square):
+        """Internal, build the record and annotation of an event whose date has been validated and positioned"""
         if color is None:
             color = random_color()
 
-        self._event_records.append({
-            "text": text, "date": date, "color": color,
-            "hint": hint, "side": side, "color_square": color_square,
-        })
-
         default_x = self.xmax if (position.x >= self.xmax / 2) else 0
         label_point = self.__get_label_point(hint, side, default_x, position.y)
 
@@ -262,10 +410,21 @@ class Lifegraph:
         if color_square:
             marker = Marker(position.x, position.y, color=color)
 
+        record = {
+            "text": text, "date": date, "color": color,
+            "hint": hint, "side": side, "color_square": color_square,
+        }
         a = Annotation(date, text, label_point=label_point, color=color,
                        event_point=Point(position.x, position.y), marker=marker,
                        source_y_range=(position.y, position.y))
-        self.annotations.append(a)
+        return record, a
+
+    def __append_life_events(self, built):
+        """Internal, add the (record, annotation) pairs made by __make_life_event"""
+        for record, a in built:
+            self._event_records.append(record)
+            self.annotations.append(a)
+        self._dirty = True
 
     def add_era(self, text, start_date, end_date, color=None, side=None, alpha=0.3):
         """Highlight a period of your life with a colored background.
@@ -319,7 +478,7 @@ class Lifegraph:
             Era(text, start_position, end_position, color, alpha=alpha))
 
         label_point = self.__get_label_point(
-            hint=None, side=side, default_x=self.xmax, default_y=np.average((start_position.y, end_position.y)), is_Era=True)
+            hint=None, side=side, default_x=self.xmax, default_y=0.5 * (start_position.y + end_position.y), is_Era=True)
         # when sorting the annotation the date is used
         # choose the middle date so that the annotation ends up
         # as close to the middle of the era as possible
@@ -330,6 +489,7 @@ class Lifegraph:
                        event_point=label_point, put_circle_around_point=False,
                        source_y_range=(start_position.y, end_position.y))
         self.annotations.append(a)
+        self._dirty = True
 
     def add_era_span(self, text, start_date, end_date, color=None, hint=None, side=None, color_start_and_end_markers=False):
         """Add a dumbbell-shaped annotation marking a time span.
@@ -385,7 +545,7 @@ class Lifegraph:
         start_position = self.__to_date_position(start_date)
         end_position = self.__to_date_position(end_date)
         label_point = self.__get_label_point(
-            hint, side, self.xmax, np.average((start_position.y, end_position.y)))
+            hint, side, self.xmax, 0.5 * (start_position.y + end_position.y))
 
         start_marker = None
         end_marker = None
@@ -400,12 +560,12 @@ class Lifegraph:
 
         middle_date = start_date + (end_date - start_date)/2
 
-        event_point = Point(np.average((start_position.x, end_position.x)), np.average(
-            (start_position.y, end_position.y)))
+        event_point = Point(0.5 * (start_position.x + end_position.x), 0.5 * (start_position.y + end_position.y))
 
         self.annotations.append(Annotation(middle_date, text, label_point=label_point,
                                            color=color, event_point=event_point, put_circle_around_point=False,
                                            source_y_range=(start_position.y, end_position.y)))
+        self._dirty = True
 
     def add_watermark(self, text):
         """Add diagonal watermark text across the graph.
@@ -420,6 +580,7 @@ class Lifegraph:
         >>> g.add_watermark("DRAFT")
         """
         self.watermark_text = text
+        self._dirty = True
 
     def add_title(self, text, fontsize=None):
         """Add a title above the graph.
@@ -438,6 +599,7 @@ class Lifegraph:
         self.title = text
         if fontsize is not None:
             self.title_fontsize = fontsize
+        self._dirty = True
 
     def add_image(self, image_name, alpha=1):
         """Overlay an image on the graph axes.
@@ -446,8 +608,11 @@ class Lifegraph:
 
         Parameters
         ----------
-        image_name : str
-            Path to the image file.
+        image_name : str or numpy.ndarray
+            Path to the image file, or an already decoded image array (as
+            returned by :func:`matplotlib.pyplot.imread`).  Passing an array
+            avoids decoding the same file again for every graph; arrays are
+            not written by :meth:`save_config`.
         alpha : float, optional
             Opacity of the image overlay.  Default is ``1``.
 
@@ -455,14 +620,22 @@ class Lifegraph:
         --------
         >>> g.add_image("background.jpg", alpha=0.5)
         """
-        self.image_name = image_name
+        if isinstance(image_name, np.ndarray):
+            self.image_name = None
+            self.image_data = image_name
+        else:
+            self.image_name = image_name
+            self.image_data = None
         self.image_alpha = alpha
+        self._dirty = True
 
     def draw(self):
         """Render the graph onto the axes.
 
         Call this explicitly when using a provided *ax* and you want to
         trigger rendering before saving or showing the figure yourself.
+        The graph is always redrawn, so edits made in place to its
+        attributes are picked up.
 
         Examples
         --------
@@ -473,8 +646,27 @@ class Lifegraph:
         >>> fig.savefig("out.png")
         >>> plt.close(fig)
         """
+        self._dirty = True
         self.__draw()
 
+    def invalidate(self):
+        """Mark the graph as changed, so the next :meth:`save` redraws it.
+
+        The ``add_*`` and ``format_*`` methods do this already.  Call it after
+        editing :attr:`settings`, :attr:`annotations`, :attr:`eras` or
+        :attr:`era_spans` in place.
+
+        Examples
+        --------
+        >>> g = Lifegraph(date(1990, 1, 1))
+        >>> g.add_era("College", date(2008, 9, 1), date(2012, 5, 15), color="blue")
+        >>> g.save("my_life.png")
+        >>> g.eras[0].color = "red"
+        >>> g.invalidate()
+        >>> g.save("my_life.png")
+        """
+        self._dirty = True
+
     def show(self):
         """Render the graph and display it interactively.
 
@@ -487,8 +679,10 @@ class Lifegraph:
         >>> g.add_title("My Life")
         >>> g.show()
         """
+        self._dirty = True
         self.__draw()
         if self.owns_figure:
+            import matplotlib.pyplot as plt
             plt.show()
         # If not owning the figure, the user should call plt.show() on their figure
 
@@ -498,9 +692,11 @@ class Lifegraph:
         Only has an effect when the figure was created internally (i.e. no
         *ax* was provided).
         """
-        if self.owns_figure and hasattr(self, 'fig'):
+        if self.owns_figure and self.fig is not None:
+            import matplotlib.pyplot as plt
             self.fig.clf()
             plt.close()
+            self._dirty = True
 
     def save(self, name, transparent=False):
         """Render the graph and save it to a file.
@@ -512,6 +708,15 @@ class Lifegraph:
         transparent : bool, optional
             Save with a transparent background.  Default is ``False``.
 
+        Notes
+        -----
+        The graph is only redrawn when it changed since the last draw, so
+        saving it to several files renders it once.  The ``add_*``,
+        ``format_*`` and :meth:`show_max_age_label` methods mark it as
+        changed.  After editing :attr:`settings`, :attr:`annotations`,
+        :attr:`eras` or :attr:`era_spans` in place, call :meth:`invalidate`
+        (or :meth:`draw`) before saving again.
+
         Examples
         --------
         >>> g = Lifegraph(date(1990, 1, 1))
@@ -522,7 +727,7 @@ class Lifegraph:
         # This allows the user to call g.save() conveniently
         self.fig.savefig(name, transparent=transparent, bbox_inches='tight')
 
-    def save_config(self, path, include_styling=False):
+    def save_config(self, path, include_styling=False, date_format="iso"):
         """Export the graph configuration to a JSON or YAML file.
 
         The file format is inferred from the extension: ``.json`` for JSON,
@@ -535,8 +740,33 @@ class Lifegraph:
         include_styling : bool, optional
             If ``True``, axis label customisations are included.
             Default is ``False``.
+        date_format : {"iso", "ordinal"}, optional
+            How dates are written.  ``"iso"`` (default) writes readable
+            ``YYYY-MM-DD`` strings; ``"ordinal"`` writes the integers of
+            :meth:`datetime.date.toordinal`, which are quicker to read back.
+            Both are understood by :meth:`from_config`.
         """
-        serialization.export_config(self, path, include_styling=include_styling)
+        serialization.export_config(self, path, include_styling=include_styling, date_format=date_format)
+
+    def to_dict(self, include_styling=False, date_format="iso"):
+        """Return the graph configuration as a plain dictionary.
+
+        The dictionary has the same layout as the files written by
+        :meth:`save_config` and can be passed to :meth:`from_dict`.
+
+        Parameters
+        ----------
+        include_styling : bool, optional
+            If ``True``, axis label customisations are included.
+            Default is ``False``.
+        date_format : {"iso", "ordinal"}, optional
+            How dates are stored; see :meth:`save_config`.
+
+        Returns
+        -------
+        dict
+        """
+        return serialization.config_to_dict(self, include_styling=include_styling, date_format=date_format)
 
     @classmethod
     def from_config(cls, path, apply_styling=True):
@@ -555,17 +785,52 @@ class Lifegraph:
         Lifegraph
         """
         return serialization.import_config(cls, path, apply_styling=apply_styling)
+
+    @classmethod
+    def from_dict(cls, d, apply_styling=True):
+        """Create a Lifegraph from a configuration dictionary.
+
+        This is the in-memory counterpart of :meth:`from_config`; *d* uses
+        the layout produced by :meth:`to_dict`.
+
+        Parameters
+        ----------
+        d : dict
+            The configuration dictionary.
+        apply_styling : bool, optional
+            If ``True`` (default) and *d* contains a ``styling`` section,
+            axis customisations are applied.
+
+        Returns
+        -------
+        Lifegraph
+        """
+        return serialization.config_from_dict(cls, d, apply_styling=apply_styling)
     #endregion Public drawing methods
 
     #region Private drawing methods
     def __draw(self):
-        """Internal, trigger drawing of the graph"""
+        """Internal, trigger drawing of the graph
+
+        Does nothing when the graph has already been drawn and nothing has changed since, so
+        saving the same graph to several files only renders it once.
+        """
+        if not self._dirty and self.fig is not None:
+            return
+
+        # pyplot and the drawing modules are imported on first draw, so that building or
+        # loading a graph does not pay for them
+        import matplotlib.pyplot as plt
         plt.rcParams.update(self.settings.rcParams)
 
         # Use provided axes or create new figure and axes
         if self.ax is None:
             self.fig = plt.figure()
             self.ax = self.fig.add_axes(self.axes_rect)
+        elif self.owns_figure:
+            # redrawing our own figure, start from an empty one instead of creating another
+            self.fig.clear()
+            self.ax = self.fig.add_axes(self.axes_rect)
         else:
             # When using provided axes, get the figure from the axes
             self.fig = self.ax.figure
@@ -573,10 +838,9 @@ class Lifegraph:
         # Apply spine styling directly to axes (handles provided axes case)
         self.ax.spines[:].set_visible(False)
 
-        xs = np.arange(1, self.xmax+1)
-        ys = [np.arange(self.min_age, self.ymax) for i in range(self.xmax)]
-
-        self.ax.plot(xs, ys)
+        # the grid squares are the markers of a single unconnected line (see lines.* in the style
+        # file), one point per week of every visible year
+        self.ax.plot(*_grid_points(self.xmax, self.min_age, self.ymax))
 
         self.__draw_xaxis()
         self.__draw_yaxis()
@@ -588,7 +852,12 @@ class Lifegraph:
         # transform used during measurement differs from the final render
         # (bbox_inches='tight' crops whitespace, changing the effective
         # scale), causing the conflict resolver to underestimate label sizes.
-        self.fig.savefig(io.BytesIO(), format='png', bbox_inches='tight')
+        # Only the draw matters here, so write raw RGBA and skip the PNG encode.
+        self.fig.savefig(io.BytesIO(), format='raw', bbox_inches='tight')
+        if not hasattr(self.fig.canvas, "get_renderer"):
+            # a Figure made without pyplot has no canvas that can render, measure with Agg
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            FigureCanvasAgg(self.fig)
         self.renderer = self.fig.canvas.get_renderer()
 
         self.__draw_annotations()
@@ -598,49 +867,42 @@ class Lifegraph:
         self.__draw_title()
         self.__draw_image()
         self.__draw_max_age()
+        self._dirty = False
 
     def __draw_xaxis(self):
         """Internal, draw the components of the x-axis"""
         self.ax.set_xlim(self.xlims)
         # put x ticks on top
-        xticks = [1]
-        xticks.extend(range(5, self.xmax+1, 5))
-        fs = self.settings.rcParams["axes.labelsize"] if self.settings.otherParams[
-            "xlabel.fontsize"] is None else self.settings.otherParams["xlabel.fontsize"]
-        color = self.settings.rcParams["axes.labelcolor"] if self.settings.otherParams[
-            "xlabel.color"] is None else self.settings.otherParams["xlabel.color"]
+        xticks = _xticks(self.xmax)
+        rc, other = self.settings.rcParams, self.settings.otherParams
+        fs = rc["axes.labelsize"] if other["xlabel.fontsize"] is None else other["xlabel.fontsize"]
+        color = rc["axes.labelcolor"] if other["xlabel.color"] is None else other["xlabel.color"]
         self.ax.set_xticks(xticks)
         self.ax.set_xticklabels(xticks)
         self.ax.set_xlabel(self.xaxis_label, fontsize=fs, color=color)
         self.ax.xaxis.set_label_position('top')
         if self.owns_figure:
-            self.ax.xaxis.set_label_coords(
-                *self.settings.otherParams["xlabel.position"])
+            self.ax.xaxis.set_label_coords(*other["xlabel.position"])
         self.ax.tick_params(axis='x', which='major', top=False, bottom=False,
                             labeltop=True, labelbottom=False, pad=-3,
-                            labelsize=self.settings.rcParams["xtick.labelsize"])
+                            labelsize=rc["xtick.labelsize"])
         self.ax.tick_params(axis='x', which='minor', top=False, bottom=False)
 
     def __draw_yaxis(self):
         """Internal, draw the components of the y-axis"""
         self.ax.set_ylim(self.ylims)
         # set y ticks
-        # Start from the first multiple of 5 >= min_age
-        first_tick_5 = self.min_age + (5 - self.min_age % 5) % 5
-        yticks = [self.min_age] if self.min_age % 5 != 0 else []
-        yticks.extend(range(first_tick_5, self.ymax, 5))
-        fs = self.settings.rcParams["axes.labelsize"] if self.settings.otherParams[
-            "ylabel.fontsize"] is None else self.settings.otherParams["ylabel.fontsize"]
-        color = self.settings.rcParams["axes.labelcolor"] if self.settings.otherParams[
-            "ylabel.color"] is None else self.settings.otherParams["ylabel.color"]
+        yticks = _yticks(self.min_age, self.ymax)
+        rc, other = self.settings.rcParams, self.settings.otherParams
+        fs = rc["axes.labelsize"] if other["ylabel.fontsize"] is None else other["ylabel.fontsize"]
+        color = rc["axes.labelcolor"] if other["ylabel.color"] is None else other["ylabel.color"]
         self.ax.set_yticks(yticks)
         self.ax.set_ylabel(self.yaxis_label, fontsize=fs, color=color)
         if self.owns_figure:
-            self.ax.yaxis.set_label_coords(
-                *self.settings.otherParams["ylabel.position"])
+            self.ax.yaxis.set_label_coords(*other["ylabel.position"])
         self.ax.tick_params(axis='y', which='major', left=False, right=False,
                             pad=-4,
-                            labelsize=self.settings.rcParams["ytick.labelsize"])
+                            labelsize=rc["ytick.labelsize"])
         self.ax.tick_params(axis='y', which='minor', left=False, right=False)
         self.ax.invert_yaxis()
 
@@ -650,34 +912,73 @@ class Lifegraph:
         The arrowprops keyword arguments to the annotation, shrinkB, is calculated so that
         regardless of plot size, the edge of the annotation line ends at the edge of the circle
         """
-        visible = [a for a in self.annotations if self.__is_annotation_visible(a)]
+        from matplotlib.markers import MarkerStyle
+
+        visible = self.__visible_annotations()
         final = self.__resolve_annotation_conflicts(visible)
 
-        shrinkB = self.settings.rcParams["lines.markersize"]+self.settings.rcParams["lines.markeredgewidth"]
+        ms = self.settings.rcParams["lines.markersize"]
+        mew = self.settings.rcParams["lines.markeredgewidth"]
+        shrinkB = ms+mew
+
+        # the circles around the event points and the colored squares are drawn with one
+        # scatter per marker style rather than one Line2D per annotation; zorder matches Line2D
+        circled = [a for a in final if a.put_circle_around_point]
+        if circled:
+            self.ax.scatter([a.event_point.x for a in circled], [a.event_point.y for a in circled],
+                            s=(ms*2.0)**2, marker=MarkerStyle('o', fillstyle='none'),
+                            c=mcolors.to_rgba_array([a.color for a in circled]), linewidths=mew, zorder=2)
+
+        self.__draw_markers([a.marker for a in final if a.marker is not None])
+
+        # properties shared by every arrow, only the color and relpos differ per annotation
+        arrowprops = dict(arrowstyle='-',
+                          connectionstyle='arc3',
+                          shrinkA=self.settings.otherParams["annotation.shrinkA"],
+                          shrinkB=shrinkB,
+                          linewidth=self.settings.otherParams["annotation.line.width"])
         for a in final:
-            if a.put_circle_around_point:
-                self.ax.plot(a.event_point.x, a.event_point.y, marker='o', markeredgecolor=a.color,
-                             ms=self.settings.rcParams["lines.markersize"]*2.0)
-
-            if a.marker is not None:
-                self.ax.plot(
-                    a.marker.x, a.marker.y, markeredgecolor=a.marker.color, marker=a.marker.marker)
-
             self.ax.annotate(a.text, xy=(a.event_point.x, a.event_point.y), xytext=(a.x, a.y),
                              weight='bold', color=a.color, va='center', ha='left',
-                             arrowprops=dict(arrowstyle='-',
-                                             connectionstyle='arc3',
-                                             color=a.color,
-                                             shrinkA=self.settings.otherParams["annotation.shrinkA"],
-                                             shrinkB=shrinkB,
-                                             # search for 'relpos' on https://matplotlib.org/tutorials/text/annotations.html
-                                             relpos=a.relpos,
-                                             linewidth=self.settings.otherParams["annotation.line.width"]))
+                             # search for 'relpos' on https://matplotlib.org/tutorials/text/annotations.html
+                             arrowprops={**arrowprops, 'color': a.color, 'relpos': a.relpos})
+
+    def __draw_markers(self, markers, edgecolor=None):
+        """Internal, draw colored grid squares with one scatter per marker style
+
+        Sized like the grid squares, with the zorder of a Line2D.
+
+        :param markers: A list of Markers
+        :param edgecolor: Color of every marker's outline, or None to use each Marker's color
+
+        """
+        from matplotlib.markers import MarkerStyle
+
+        ms = self.settings.rcParams["lines.markersize"]
+        mew = self.settings.rcParams["lines.markeredgewidth"]
+        by_style = {}
+        for m in markers:
+            by_style.setdefault((m.marker, m.fillstyle), []).append(m)
+        for (style, fillstyle), group in by_style.items():
+            # the markers are hollow, so c is what colors the outline
+            colors = [m.color for m in group] if edgecolor is None else [edgecolor] * len(group)
+            self.ax.scatter([m.x for m in group], [m.y for m in group],
+                            s=ms**2, marker=MarkerStyle(style, fillstyle=fillstyle),
+                            c=mcolors.to_rgba_array(colors), linewidths=mew, zorder=2)
 
     def __draw_eras(self):
-        """Internal, draw all of the eras on the graph"""
-        xmin = self.ax.transLimits.transform((1-.5, 0))[0]
-        xmax = self.ax.transLimits.transform((self.xmax+.5, 0))[0]
+        """Internal, draw all of the eras on the graph
+
+        Every row covered by every era becomes one rectangle of a single
+        PolyCollection. The x values are in axes coordinates and the y values
+        in data coordinates, the same convention axhspan uses.
+        """
+        from matplotlib.collections import PolyCollection
+
+        xmin = self.__x_to_axes(1-.5)
+        xmax = self.__x_to_axes(self.xmax+.5)
+        verts = []
+        colors = []
         for era in self.eras:
             # skip eras entirely outside the visible range
             if era.end.y < self.min_age or era.start.y >= self.ymax:
@@ -685,72 +986,90 @@ class Lifegraph:
             # clip row iteration to visible range
             row_start = max(era.start.y, self.min_age)
             row_end = min(era.end.y, self.ymax - 1)
-            for y in range(row_start, row_end+1):
-                if y == era.start.y:
-                    axesUnits = self.ax.transLimits.transform(
-                        (era.start.x-.5, era.start.y))
-                    self.ax.axhspan(y-.5, y+.5, facecolor=era.color,
-                                    alpha=era.alpha, xmin=axesUnits[0], xmax=xmax)
-                elif y == era.end.y:
-                    axesUnits = self.ax.transLimits.transform(
-                        (era.end.x+.5, era.end.y))
-                    self.ax.axhspan(y-.5, y+.5, facecolor=era.color,
-                                    alpha=era.alpha, xmin=xmin, xmax=axesUnits[0])
-                else:
-                    self.ax.axhspan(y-.5, y+.5, facecolor=era.color,
-                                    alpha=era.alpha, xmin=xmin, xmax=xmax)
+            ys = np.arange(row_start, row_end+1, dtype=float)
+            # the first row starts at the start week and runs to the edge of the grid,
+            # the last row runs from the edge of the grid to the end week
+            is_start = ys == era.start.y
+            is_end = (ys == era.end.y) & ~is_start
+            x0 = np.where(is_start, self.__x_to_axes(era.start.x-.5), xmin)
+            x1 = np.where(is_end, self.__x_to_axes(era.end.x+.5), xmax)
+            rects = np.empty((len(ys), 4, 2))
+            rects[:, :2, 0] = x0[:, None]
+            rects[:, 2:, 0] = x1[:, None]
+            rects[:, [0, 3], 1] = (ys - .5)[:, None]
+            rects[:, [1, 2], 1] = (ys + .5)[:, None]
+            verts.append(rects)
+            colors.append(np.broadcast_to(mcolors.to_rgba(era.color, era.alpha), (len(ys), 4)))
+
+        if verts:
+            eras = PolyCollection(np.concatenate(verts), facecolors=np.concatenate(colors),
+                                  edgecolors='none', transform=self.ax.get_yaxis_transform())
+            self.ax.add_collection(eras, autolim=False)
+
+    def __x_to_axes(self, x):
+        """Internal, convert a data x value to an axes fraction
+
+        The x limits are fixed and linear, so this is what ax.transLimits computes without a
+        round trip through the transform machinery.
+
+        :param x: Value in data coordinates
+
+        """
+        return (x - self.xlims[0]) / (self.xlims[1] - self.xlims[0])
 
     def __draw_era_spans(self):
         """Internal, draw all of the dumbbell era spans on the graph
 
         This is done by placing a circle around the start and end point. Then a line is drawn
-        starting at the edge of each circle. The edge is found using a quadrant sensitive inverse
-        tangent function and parametric equations of a circle.
+        starting at the edge of each circle. The edge is found by stepping one radius along the
+        unit vector from one center to the other; the endpoints of all spans are computed at once.
 
         """
-        for era in self.era_spans:
-            # skip era spans entirely outside the visible range
-            if era.end.y < self.min_age or era.start.y >= self.ymax:
-                continue
-            radius = .5
-            circle1 = plt.Circle((era.start.x, era.start.y), radius,
-                                 color=era.color, fill=False, lw=self.settings.otherParams["annotation.edge.width"])
-            circle2 = plt.Circle((era.end.x, era.end.y), radius,
-                                 color=era.color, fill=False, lw=self.settings.otherParams["annotation.edge.width"])
-            self.ax.add_artist(circle1)
-            self.ax.add_artist(circle2)
-
-            # to draw the line between the two circles, we need to find the point on the
-            # each circle that is closest to the other circle
-            # get the angle from one circle to the other and find the point on the circle
-            # that lies at that angle
-            x1 = era.end.x - era.start.x
-            y1 = era.end.y - era.start.y
-
-            x2 = era.start.x - era.end.x
-            y2 = era.start.y - era.end.y
-
-            # quadrant senstive arctan
-            angle1 = np.arctan2(y1, x1)
-            angle2 = np.arctan2(y2, x2)
-
-            x1 = era.start.x + np.cos(angle1) * radius
-            y1 = era.start.y + np.sin(angle1) * radius
-
-            x2 = era.end.x + np.cos(angle2) * radius
-            y2 = era.end.y + np.sin(angle2) * radius
-
-            if era.start_marker is not None:
-                self.ax.plot(era.start_marker.x, era.start_marker.y, color=era.start_marker.color, marker=era.start_marker.marker,
-                             fillstyle=era.start_marker.fillstyle)
-
-            if era.end_marker is not None:
-                self.ax.plot(era.end_marker.x, era.end_marker.y, color=era.end_marker.color, marker=era.end_marker.marker,
-                             fillstyle=era.end_marker.fillstyle)
-
-            line = mlines.Line2D([x1, x2], [y1, y2], color=era.color, linestyle=self.settings.otherParams["era.span.linestyle"],
-                              markersize=self.settings.otherParams["era.span.markersize"], linewidth=self.settings.otherParams["annotation.line.width"])
-            self.ax.add_line(line)
+        from matplotlib.collections import EllipseCollection, LineCollection
+        from matplotlib.markers import MarkerStyle
+
+        # skip era spans entirely outside the visible range
+        spans = [era for era in self.era_spans if not (era.end.y < self.min_age or era.start.y >= self.ymax)]
+        if not spans:
+            return
+
+        radius = .5
+        starts = np.array([(era.start.x, era.start.y) for era in spans], dtype=float)
+        ends = np.array([(era.end.x, era.end.y) for era in spans], dtype=float)
+        d = ends - starts
+        norm = np.hypot(d[:, 0], d[:, 1])[:, None]
+        # a span that starts and ends in the same square has no direction, collapse its line
+        u = np.divide(d, norm, out=np.zeros_like(d), where=norm > 0)
+        p1 = starts + u * radius
+        p2 = ends - u * radius
+
+        colors = mcolors.to_rgba_array([era.color for era in spans])
+
+        # one circle around each start and end point, all in a single collection
+        circles = EllipseCollection(2 * radius, 2 * radius, 0, units='xy',
+                                    offsets=np.concatenate([starts, ends]), offset_transform=self.ax.transData,
+                                    facecolors='none', edgecolors=np.concatenate([colors, colors]),
+                                    linewidths=self.settings.otherParams["annotation.edge.width"])
+        self.ax.add_collection(circles, autolim=False)
+
+        # the span squares are outlined in lines.markeredgecolor ('auto' means the marker's own color),
+        # the same edge a Line2D marker would get
+        edgecolor = matplotlib.rcParams["lines.markeredgecolor"]
+        self.__draw_markers([m for era in spans for m in (era.start_marker, era.end_marker) if m is not None],
+                            edgecolor=None if edgecolor == 'auto' else edgecolor)
+
+        # the dumbbell bars, zorder matches Line2D so they draw above the eras
+        bars = LineCollection(np.stack([p1, p2], axis=1), colors=colors,
+                              linestyles=self.settings.otherParams["era.span.linestyle"],
+                              linewidths=self.settings.otherParams["annotation.line.width"], zorder=2)
+        self.ax.add_collection(bars, autolim=False)
+
+        markersize = self.settings.otherParams["era.span.markersize"]
+        if markersize:
+            ends_of_bars = np.concatenate([p1, p2])
+            self.ax.scatter(ends_of_bars[:, 0], ends_of_bars[:, 1], s=markersize**2,
+                            marker=MarkerStyle(matplotlib.rcParams["lines.marker"], fillstyle='none'),
+                            c=np.concatenate([colors, colors]), zorder=2)
 
     def __draw_watermark(self):
         """Internal, draw the watermakr"""
@@ -766,8 +1085,9 @@ class Lifegraph:
 
     def __draw_image(self):
         """Internal, draw the image"""
-        if self.image_name is not None:
-            img = mpimg.imread(self.image_name)
+        if self.image_name is not None or self.image_data is not None:
+            import matplotlib.image as mpimg
+            img = self.image_data if self.image_data is not None else mpimg.imread(self.image_name)
             extent = (0.5, self.xmax+0.5, self.ymax-0.5, self.min_age - 0.5)
             self.ax.imshow(img, extent=extent, origin='upper',
                            alpha=self.image_alpha)
@@ -796,34 +1116,34 @@ class Lifegraph:
         # the x-value is only corrected if it is inside the graph or too close to the graph
         left = []
         right = []
+        right_offset = self.settings.otherParams["annotation.right.offset"]
+        left_offset = self.settings.otherParams["annotation.left.offset"]
+        xmin, xmax, mid = self.xmin, self.xmax, self.xmax / 2
+        min_age, ymax = self.min_age, self.ymax
+        # first, get the bounds
+        self.__set_annotation_bboxes(annotations)
         for a in annotations:
-            # first, get the bounds
-            self.__set_annotation_bbox(a)
-
             # now set the intitial positions
             # we want all of the text to be on the left or right of the squares
             width = a.bbox.width
             # to preserve hint values, only set the x value if it is inside the graph
             # or if it is not at least as far as the offset
-            if a.y >= self.min_age and a.y <= self.ymax:
-                if ((a.x >= self.xmax / 2) and (a.x < self.xmax)) or (a.x >= self.xmax and a.x < self.xmax + self.settings.otherParams["annotation.right.offset"]):
-                    a.x = self.xmax + \
-                        self.settings.otherParams["annotation.right.offset"]
-                elif ((a.x >= 0) and (a.x < self.xmax / 2)) or (a.x <= self.xmin and a.x > self.xmin - self.settings.otherParams["annotation.left.offset"]):
-                    a.x = self.xmin - \
-                        self.settings.otherParams["annotation.left.offset"] - width
-                a.bbox.x0 = a.x
-                a.bbox.x1 = a.x + width
-                if (a.x >= self.xmax / 2):
+            if a.y >= min_age and a.y <= ymax:
+                if ((a.x >= mid) and (a.x < xmax)) or (a.x >= xmax and a.x < xmax + right_offset):
+                    a.x = xmax + right_offset
+                elif ((a.x >= 0) and (a.x < mid)) or (a.x <= xmin and a.x > xmin - left_offset):
+                    a.x = xmin - left_offset - width
+                a.set_x(a.x)
+                if (a.x >= mid):
                     a.set_relpos((0, 0.5))
                     right.append(a)
-                if (a.x < self.xmax / 2):
+                if (a.x < mid):
                     a.set_relpos((1, 0.5))
                     left.append(a)
-            elif a.y < self.min_age:
+            elif a.y < min_age:
                 a.set_relpos((0.5, 0))
                 right.append(a)
-            elif a.y > self.ymax:
+            elif a.y > ymax:
                 a.set_relpos((0.5, 1))
                 right.append(a)
 
@@ -831,13 +1151,13 @@ class Lifegraph:
         # with lower x values to minimize the crossover of annotation lines
         # for the right, we want to prioritize labels that are closer
         # to the right side of the graph to minimize the crossover of annotation lines
-        left.sort(key=lambda a: (a.event_point.y, a.event_point.x))
-        right.sort(key=lambda a: (a.event_point.y, -a.event_point.x))
+        left = self.__placement_order(left, x_sign=1)
+        right = self.__placement_order(right, x_sign=-1)
 
         # Compute a dynamic epsilon based on median bbox height so that the
         # gap scales with figure size, DPI, font size, and y-axis range.
         import statistics
-        heights = [abs(a.bbox.ymax - a.bbox.ymin) for a in annotations]
+        heights = [abs(a.extents[3] - a.extents[2]) for a in annotations]
         if heights:
             dynamic_eps = max(self.label_space_epsilon,
                               statistics.median(heights) * 0.4)
@@ -846,53 +1166,94 @@ class Lifegraph:
 
         final = []
         for lst in [left, right]:
-            _f = []
-            for unchecked in lst:
-                for checked in _f:
-                    if unchecked.overlaps(checked):
-                        correction = unchecked.get_xy_correction(
-                            checked, dynamic_eps)
-                        unchecked.update_Y_with_correction(correction)
-                    if unchecked.is_within_epsilon_of(checked, dynamic_eps):
-                        correction = [0, dynamic_eps]
-                        unchecked.update_Y_with_correction(correction)
-                _f.append(unchecked)
-            final.extend(_f)
+            AnnotationBatch(lst).resolve_conflicts(dynamic_eps)
+            final.extend(lst)
 
         return final
 
-    def __is_annotation_visible(self, a):
-        """Return True if the annotation's source overlaps [min_age, max_age)."""
-        if a.source_y_range is None:
-            return True
-        y_lo, y_hi = a.source_y_range
-        return y_hi >= self.min_age and y_lo < self.ymax
+    def __placement_order(self, annotations, x_sign):
+        """Internal, sort annotations by event row, then by event column times *x_sign*
+
+        The event points are gathered into arrays and ordered with one stable lexsort;
+        x_sign=-1 puts the columns closest to the right edge first.
+
+        :param annotations: A list of annotations
+        :param x_sign: 1 or -1
+
+        """
+        points = np.array([(a.event_point.x, a.event_point.y) for a in annotations], dtype=float).reshape(-1, 2)
+        order = np.lexsort((x_sign * points[:, 0], points[:, 1]))
+        return [annotations[i] for i in order]
+
+    def __visible_annotations(self):
+        """Internal, the annotations whose source overlaps [min_age, max_age)
+
+        The source ranges are tested as arrays in one comparison. An annotation without a
+        source range is always visible. The range array is built from the public annotations
+        list on every call, so it cannot drift from edits made to that list.
+        """
+        ranges = np.fromiter((a.source_y_range if a.source_y_range is not None else (-np.inf, np.inf)
+                              for a in self.annotations),
+                             dtype=np.dtype((float, 2)), count=len(self.annotations))
+        mask = (ranges[:, 1] >= self.min_age) & (ranges[:, 0] < self.ymax)
+        return [self.annotations[i] for i in np.flatnonzero(mask)]
 
     def __validate_date(self, date):
         """Raise ValueError if *date* is outside ``[birthdate, birthdate + max_age]``."""
-        max_date = self.birthdate + relativedelta(years=self.ymax)
-        if date < self.birthdate or date > max_date:
+        if date < self.birthdate or date > self._max_date:
             raise ValueError(
                 f"The event date must be a valid datetime.date object that is at least as recent as the birthdate and no larger than {self.ymax}")
 
+    def __validate_dates(self, dates):
+        """Raise ValueError if any of *dates* is outside ``[birthdate, birthdate + max_age]``.
+
+        Only the earliest and latest dates can be out of range, so two C-level passes
+        replace one Python-level check per date.
+        """
+        if dates:
+            self.__validate_date(min(dates))
+            self.__validate_date(max(dates))
+
     def __to_date_position(self, date):
         """Internal, compose a DatePosition from a date
 
         :param date: A datetime
 
         """
-        year = relativedelta(date, self.birthdate).years
-        # Assume the start of the year for each year of your life is your birthdate
-        # something that happens within or up to (not including) 7 days after the start
-        # of the year happens in the first week of your life that year
-        # Using this logic, your birthday will always happen on week 1 of each year
-        start_of_year = self.birthdate + relativedelta(years=year)
-        diff = date - start_of_year
-        week = diff.days // 7
+        x, year = _date_to_xy(self.birthdate, date, self.xmax)
+        return DatePosition(x, year, date)
 
+    def __to_date_positions(self, dates):
+        """Internal, the vectorized form of __to_date_position for a sequence of dates
+
+        Gives exactly the same results as relativedelta. The start of year k is the birthdate
+        moved k years forward, with the day clipped to the end of the month (a Feb 29 birthday
+        starts the year on Feb 28 in common years). The year of a date is the largest k whose
+        start is not after it.
+
+        :param dates: A sequence of datetimes
+
+        """
+        if len(dates) == 0:
+            return []
+        d = np.array(dates, dtype='datetime64[D]')
+        b = self.birthdate
+
+        def start_of_year(calendar_year):
+            month = ((calendar_year - 1970) * 12 + (b.month - 1)).astype('datetime64[M]')
+            days_in_month = ((month + 1).astype('datetime64[D]') - month.astype('datetime64[D]')).astype(np.int64)
+            return month.astype('datetime64[D]') + (np.minimum(b.day, days_in_month) - 1)
+
+        calendar_year = d.astype('datetime64[Y]').astype(np.int64) + 1970
+        start = start_of_year(calendar_year)
+        before = d < start
+        start = np.where(before, start_of_year(calendar_year - 1), start)
+        year = calendar_year - b.year - before
+
+        week = (d - start).astype(np.int64) // 7
         x = week % self.xmax + 1
 
-        return DatePosition(x, year, date)
+        return [DatePosition(int(xi), int(yi), date) for xi, yi, date in zip(x, year, dates)]
 
     def __sanitize_hint(self, hint):
         """Internal, Hints should have an x value < 0 or bigger than self.xmax
@@ -912,25 +1273,29 @@ class Lifegraph:
 
         return hint
 
-    def __set_annotation_bbox(self, a):
-        """Internal, determine the bounding box of some text to aid in layout
+    def __set_annotation_bboxes(self, annotations):
+        """Internal, determine the bounding boxes of the label texts to aid in layout
 
-        :param a: A string of text
+        The anchors of all labels go through transData in one call, and all of the display
+        boxes come back to data units through a single inverse transform.
 
-        """
-        # put the text on the plot temporarily so that we can determine the width of the text
-        t = self.ax.text(a.x, a.y, a.text, transform=self.ax.transData,
-                         ha='left', va='center', weight='bold')
+        :param annotations: A list of annotations
 
+        """
+        if not annotations:
+            return
         if (self.renderer is None):
             self.renderer = self.fig.canvas.get_renderer()
 
-        # in display units
-        bbox = t.get_window_extent(renderer=self.renderer)
-        # now convert it to data units
-        bbox_data_units = self.ax.transData.inverted().transform(bbox)
-        a.set_bbox(Bbox(bbox_data_units))
-        t.remove()
+        # in display units, the layout box measured relative to the anchor moved to the anchor
+        anchors = self.ax.transData.transform([(a.x, a.y) for a in annotations])
+        layouts = np.array([layout.get_points() for layout in
+                            _label_layouts_for([a.text for a in annotations], self.fig, self.renderer)])
+        corners = layouts + anchors[:, None, :]
+        # now convert them to data units
+        corners = self.ax.transData.inverted().transform(corners.reshape(-1, 2)).reshape(-1, 2, 2)
+        for a, c in zip(annotations, corners):
+            a.set_bbox(Bbox(c))
 
     def __get_label_point(self, hint=None, side=None, default_x=0, default_y=0, is_Era=False):
         """Internal, determine the initial position of the label using the defaults and the hint or side
@@ -954,7 +1319,7 @@ class Lifegraph:
             labely = hint.y
 
         if side is not None:
-            if side == Side.LEFT:
+            if side is Side.LEFT:
                 labelx = 0 if not is_Era else 1
             else:
                 labelx = self.xmax
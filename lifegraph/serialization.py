@@ -8,6 +8,10 @@ from lifegraph.core import Point, Side
 
 CONFIG_VERSION = 1
 
+# name lookups for parsing; __members__ keeps any enum aliases
+_SIDE_BY_NAME = {name.lower(): side for name, side in Side.__members__.items()}
+_PAPER_BY_NAME = dict(Papersize.__members__)
+
 
 def _infer_format(path):
     ext = Path(path).suffix.lower()
@@ -32,10 +36,17 @@ def _get_yaml():
 # Serialization helpers
 # ---------------------------------------------------------------------------
 
+DATE_FORMATS = ("iso", "ordinal")
+
+
 def _serialize_date(d):
     return d.isoformat()
 
 
+def _serialize_date_ordinal(d):
+    return d.toordinal()
+
+
 def _serialize_color(c):
     if isinstance(c, tuple):
         return list(c)
@@ -45,8 +56,10 @@ def _serialize_color(c):
 def _serialize_hint(h):
     if h is None:
         return None
-    if isinstance(h, Point):
+    try:
         return [h.x, h.y]
+    except AttributeError:
+        pass
     if isinstance(h, (list, tuple)):
         return [h[0], h[1]]
     return None
@@ -60,12 +73,19 @@ def _serialize_side(s):
     return s
 
 
-def _build_config_dict(graph, include_styling):
+def _build_config_dict(graph, include_styling, date_format="iso"):
+    if date_format not in DATE_FORMATS:
+        raise ValueError(f"Unsupported date_format '{date_format}'. Use one of {', '.join(DATE_FORMATS)}.")
+    serialize_date = _serialize_date_ordinal if date_format == "ordinal" else _serialize_date
+
     d = {
         "version": CONFIG_VERSION,
-        "birthdate": _serialize_date(graph.birthdate),
+        "birthdate": serialize_date(graph.birthdate),
     }
 
+    if date_format != "iso":
+        d["date_format"] = date_format
+
     if graph.ymax != 90:
         d["max_age"] = graph.ymax
 
@@ -104,7 +124,7 @@ def _build_config_dict(graph, include_styling):
         for rec in graph._event_records:
             ev = {
                 "text": rec["text"],
-                "date": _serialize_date(rec["date"]),
+                "date": serialize_date(rec["date"]),
                 "color": _serialize_color(rec["color"]),
             }
             hint = _serialize_hint(rec.get("hint"))
@@ -123,8 +143,8 @@ def _build_config_dict(graph, include_styling):
         for rec in graph._era_records:
             era = {
                 "text": rec["text"],
-                "start_date": _serialize_date(rec["start_date"]),
-                "end_date": _serialize_date(rec["end_date"]),
+                "start_date": serialize_date(rec["start_date"]),
+                "end_date": serialize_date(rec["end_date"]),
                 "color": _serialize_color(rec["color"]),
             }
             side = _serialize_side(rec.get("side"))
@@ -140,8 +160,8 @@ def _build_config_dict(graph, include_styling):
         for rec in graph._era_span_records:
             span = {
                 "text": rec["text"],
-                "start_date": _serialize_date(rec["start_date"]),
-                "end_date": _serialize_date(rec["end_date"]),
+                "start_date": serialize_date(rec["start_date"]),
+                "end_date": serialize_date(rec["end_date"]),
                 "color": _serialize_color(rec["color"]),
             }
             hint = _serialize_hint(rec.get("hint"))
@@ -192,13 +212,18 @@ def _build_config_dict(graph, include_styling):
     return d
 
 
-def export_config(graph, path, include_styling=False):
+def config_to_dict(graph, include_styling=False, date_format="iso"):
+    return _build_config_dict(graph, include_styling, date_format)
+
+
+def export_config(graph, path, include_styling=False, date_format="iso"):
     fmt = _infer_format(path)
-    d = _build_config_dict(graph, include_styling)
+    d = _build_config_dict(graph, include_styling, date_format)
 
     with open(path, "w") as f:
         if fmt == "json":
-            json.dump(d, f, indent=2)
+            # encode in one go and write once; json.dump with an indent writes every token separately
+            f.write(json.dumps(d, indent=2))
         else:
             yaml = _get_yaml()
             yaml.dump(d, f, default_flow_style=False, sort_keys=False)
@@ -209,6 +234,9 @@ def export_config(graph, path, include_styling=False):
 # ---------------------------------------------------------------------------
 
 def _parse_date(s):
+    # configs written with date_format "ordinal" store days since 0001-01-01
+    if isinstance(s, int):
+        return datetime.date.fromordinal(s)
     return datetime.date.fromisoformat(s)
 
 
@@ -230,7 +258,7 @@ def _parse_side(s):
     if s is None:
         return None
     if isinstance(s, str):
-        return Side[s.upper()]
+        return _SIDE_BY_NAME[s.lower()]
     return s
 
 
@@ -238,7 +266,7 @@ def _parse_papersize(s):
     if s is None:
         return Papersize.A3
     if isinstance(s, str):
-        return Papersize[s]
+        return _PAPER_BY_NAME[s]
     return s
 
 
@@ -252,6 +280,10 @@ def import_config(cls, path, apply_styling=True):
             yaml = _get_yaml()
             d = yaml.safe_load(f)
 
+    return config_from_dict(cls, d, apply_styling=apply_styling)
+
+
+def config_from_dict(cls, d, apply_styling=True):
     version = d.get("version", 1)
     if version != CONFIG_VERSION:
         raise ValueError(f"Unsupported config version {version}. Expected {CONFIG_VERSION}.")
@@ -290,15 +322,17 @@ def import_config(cls, path, apply_styling=True):
         graph.show_max_age_label()
 
     # Events
-    for ev in d.get("events", []):
-        graph.add_life_event(
-            text=ev["text"],
-            date=_parse_date(ev["date"]),
-            color=_parse_color(ev.get("color")),
-            hint=_parse_hint(ev.get("hint")),
-            side=_parse_side(ev.get("side")),
-            color_square=ev.get("color_square", True),
-        )
+    graph.add_life_events(
+        {
+            "text": ev["text"],
+            "date": _parse_date(ev["date"]),
+            "color": _parse_color(ev.get("color")),
+            "hint": _parse_hint(ev.get("hint")),
+            "side": _parse_side(ev.get("side")),
+            "color_square": ev.get("color_square", True),
+        }
+        for ev in d.get("events", [])
+    )
 
     # Eras
     for era in d.get("eras", []):
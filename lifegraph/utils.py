@@ -8,6 +8,9 @@ for key, val in mcolors.CSS4_COLORS.items():
     if val not in exclude:
         colors.append((key, val))
 
+# the values alone, so that picking a color is a single index
+_COLOR_VALUES = tuple(val for _, val in colors)
+
 def random_color():
     """Return a random color from matplotlib's named color sets.
 
@@ -26,5 +29,27 @@ def random_color():
     >>> from lifegraph.utils import random_color
     >>> c = random_color()
     """
-    c = random.choice(colors)
-    return c[1]
+    return _COLOR_VALUES[random.randrange(len(_COLOR_VALUES))]
+
+
+def random_colors(n):
+    """Return *n* random colors from matplotlib's named color sets.
+
+    The bulk form of :func:`random_color`; colors may repeat.
+
+    Parameters
+    ----------
+    n : int
+        Number of colors to return.
+
+    Returns
+    -------
+    list of str or tuple
+        Color values accepted by matplotlib.
+
+    Examples
+    --------
+    >>> from lifegraph.utils import random_colors
+    >>> cs = random_colors(3)
+    """
+    return random.choices(_COLOR_VALUES, k=n)
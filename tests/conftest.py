@@ -0,0 +1,16 @@
+import matplotlib
+
+# Nothing in the suite needs a display, so render everything with the
+# non-interactive Agg backend instead of whatever GUI backend is the local
+# default. This has to happen before pyplot is imported.
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+import pytest  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def _close_figures():
+    """Close all matplotlib figures after every test."""
+    yield
+    plt.close("all")
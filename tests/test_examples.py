@@ -3,19 +3,16 @@
 import runpy
 from pathlib import Path
 
-import matplotlib.pyplot as plt
+import matplotlib as mpl
 import pytest
 
 EXAMPLES_DIR = Path(__file__).resolve().parent.parent / "examples"
 
-PLOT_SCRIPTS = sorted(EXAMPLES_DIR.rglob("plot_*.py"))
-
+# The examples request print-quality output; a low savefig DPI keeps the
+# rendering cheap while still exercising every drawing path.
+SAVEFIG_DPI = 72
 
-@pytest.fixture(autouse=True)
-def _close_figures():
-    """Close all matplotlib figures after every test."""
-    yield
-    plt.close("all")
+PLOT_SCRIPTS = sorted(EXAMPLES_DIR.rglob("plot_*.py"))
 
 
 @pytest.mark.parametrize(
@@ -25,9 +22,11 @@ def _close_figures():
 )
 def test_example_script(script, tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
-    runpy.run_path(str(script), run_name="__main__")
+    with mpl.rc_context({"savefig.dpi": SAVEFIG_DPI}):
+        runpy.run_path(str(script), run_name="__main__")
 
 
+@pytest.mark.slow
 def test_all_sizes(tmp_path):
     from examples.all_sizes import main
 
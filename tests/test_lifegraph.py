@@ -1,13 +1,30 @@
 import pytest
 import datetime
 import matplotlib.pyplot as plt
-from lifegraph.lifegraph import random_color, Point, DatePosition, Marker, Annotation, Era, EraSpan, Lifegraph, Side
+from lifegraph.lifegraph import random_color, Point, DatePosition, Marker, Annotation, AnnotationBatch, Era, EraSpan, Lifegraph, Side
 from lifegraph.configuration import Papersize, LifegraphParams, STYLE_PATH
 
 def test_random_color():
     color = random_color()
     assert isinstance(color, str) or isinstance(color, tuple)
 
+def test_random_colors():
+    from lifegraph.utils import random_colors, colors
+    values = [val for _, val in colors]
+    cs = random_colors(5)
+    assert len(cs) == 5
+    assert all(c in values for c in cs)
+
+def test_import_does_not_load_pyplot():
+    """Building a graph should not need pyplot; it is imported on first draw."""
+    import subprocess
+    import sys
+    code = ("import sys, datetime, lifegraph; "
+            "lifegraph.Lifegraph(datetime.date(1990, 1, 1)).add_life_event('e', datetime.date(2000, 1, 1)); "
+            "print('matplotlib.pyplot' in sys.modules)")
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "False"
+
 def test_point():
     p = Point(1, 2)
     assert p.x == 1
@@ -38,6 +55,26 @@ def test_annotation_bbox_methods():
     with pytest.raises(ValueError):
         a.is_within_epsilon_of("not an annotation", 0.1)
 
+def test_annotation_batch_resolve_conflicts():
+    """Stacked labels should be pushed apart; a distant label stays put."""
+    from matplotlib.transforms import Bbox
+    annotations = []
+    for i, (x, y) in enumerate([(0, 0), (0, 0.5), (0, 1.0), (30, 0)]):
+        a = Annotation(datetime.date(2020, 1, 1), f"A{i}", Point(x, y))
+        a.set_bbox(Bbox([[x, y - 0.5], [x + 5, y + 0.5]]))
+        annotations.append(a)
+
+    batch = AnnotationBatch(annotations)
+    assert batch.overlaps(0, slice(1, 4)).tolist() == [True, False, False]
+    batch.resolve_conflicts(0.2)
+
+    first, second, third, distant = annotations
+    assert distant.y == 0
+    assert first.y == 0
+    for lo, hi in [(first, second), (second, third)]:
+        assert not hi.overlaps(lo)
+        assert hi.bbox.ymin - lo.bbox.ymax >= 0.2
+
 def test_era_repr():
     e = Era("Test Era", datetime.date(2000,1,1), datetime.date(2001,1,1), 'red')
     assert "Test Era" in str(e)
@@ -68,7 +105,7 @@ def test_lifegraph_with_provided_axes(tmp_path):
     birthdate = datetime.date(1990, 1, 1)
     
     # Create a figure and axes
-    fig, ax = plt.subplots(figsize=(10, 8))
+    fig, ax = plt.subplots(figsize=(10, 8), dpi=50)
     
     # Create Lifegraph with the provided axes
     g = Lifegraph(birthdate, size=Papersize.A4, dpi=100, max_age=80, ax=ax)
@@ -90,16 +127,13 @@ def test_lifegraph_with_provided_axes(tmp_path):
     
     # Verify the file was created
     assert output_file.exists()
-    
-    # Clean up
-    plt.close(fig)
 
 def test_lifegraph_without_provided_axes(tmp_path):
     """Test that Lifegraph still works without a provided axes (default behavior)"""
     birthdate = datetime.date(1990, 1, 1)
     
     # Create Lifegraph without providing axes
-    g = Lifegraph(birthdate, size=Papersize.A4, dpi=100, max_age=80)
+    g = Lifegraph(birthdate, size=Papersize.A4, dpi=50, max_age=80)
     
     # Verify that no axes is initially set
     assert g.ax is None
@@ -138,7 +172,6 @@ def test_lifegraph_axes_receives_annotations(tmp_path):
     
     # Trigger drawing
     output_file = tmp_path / "test_annotations.png"
-    print("Saving to", output_file)
     g.save(str(output_file))
     
     # Verify that annotations were added to the axes
@@ -147,17 +180,100 @@ def test_lifegraph_axes_receives_annotations(tmp_path):
     
     # Verify the file was created
     assert output_file.exists()
-    
-    # Clean up
-    plt.close(fig)
+
+def test_save_twice_draws_once(tmp_path):
+    """Saving an unchanged graph again should not redraw it."""
+    g = Lifegraph(datetime.date(1990, 1, 1), max_age=50, dpi=50)
+    g.add_life_event('Event 1', datetime.date(2005, 3, 10), color='red')
+    g.save(str(tmp_path / "a.png"))
+    n_texts = len(g.ax.texts)
+    g.save(str(tmp_path / "b.pdf"))
+    assert len(g.ax.texts) == n_texts
+
+    # changing the graph marks it for drawing again
+    g.add_title("Title")
+    assert g._dirty
+    fig = g.fig
+    g.save(str(tmp_path / "c.png"))
+    assert not g._dirty
+    # the same figure is reused and nothing from the first draw is left behind
+    assert g.fig is fig
+    assert len(g.fig.axes) == 1
+    assert len(g.ax.texts) == n_texts
+    assert g.ax.get_title() == "Title"
+    g.close()
+
+def test_in_place_edits_need_invalidate_before_save(tmp_path):
+    """In-place edits are not tracked by save(); invalidate() and draw() pick them up."""
+    import matplotlib.colors as mcolors
+    from matplotlib.collections import PolyCollection
+
+    def era_color(ax):
+        eras = [c for c in ax.collections if isinstance(c, PolyCollection)]
+        return tuple(eras[-1].get_facecolors()[0][:3])
+
+    for ax in (None, plt.subplots()[1]):
+        g = Lifegraph(datetime.date(1990, 1, 1), max_age=50, dpi=50, ax=ax)
+        g.add_era("Era", datetime.date(2000, 1, 1), datetime.date(2005, 1, 1), color="red")
+        g.save(str(tmp_path / "a.png"))
+
+        g.eras[0].color = "blue"
+        g.save(str(tmp_path / "b.png"))
+        assert era_color(g.ax) == mcolors.to_rgb("red")
+
+        g.invalidate()
+        g.save(str(tmp_path / "c.png"))
+        assert era_color(g.ax) == mcolors.to_rgb("blue")
+
+        # draw() always redraws
+        g.eras[0].color = "green"
+        g.draw()
+        assert era_color(g.ax) == mcolors.to_rgb("green")
+        g.close()
+
+def test_tick_and_grid_helpers():
+    """Ticks and grid points depend only on the grid shape and are shared."""
+    from lifegraph.lifegraph import _xticks, _yticks, _grid_points
+    assert _xticks(52) == (1, 5, 10, 15, 20, 25, 30, 35, 40, 45, 50)
+    assert _yticks(0, 20) == (0, 5, 10, 15)
+    assert _yticks(22, 40) == (22, 25, 30, 35)
+    xs, ys = _grid_points(52, 10, 12)
+    assert len(xs) == len(ys) == 52 * 2
+    assert not xs.flags.writeable
+    assert _grid_points(52, 10, 12)[0] is xs
+
+def test_grid_is_one_line():
+    """The weekly squares should be the markers of a single line."""
+    birthdate = datetime.date(1990, 1, 1)
+    fig, ax = plt.subplots()
+    g = Lifegraph(birthdate, max_age=50, min_age=10, ax=ax, dpi=100)
+    g.draw()
+    assert len(ax.lines) == 1
+    assert len(ax.lines[0].get_xdata()) == 52 * 40
+
+def test_event_markers_batched():
+    """Event circles and colored squares should be drawn as one scatter each."""
+    from matplotlib.collections import PathCollection
+    birthdate = datetime.date(1990, 1, 1)
+    fig, ax = plt.subplots()
+    g = Lifegraph(birthdate, max_age=50, ax=ax, dpi=100)
+    g.add_life_event('Event 1', datetime.date(2005, 3, 10), color='red')
+    g.add_life_event('Event 2', datetime.date(2010, 8, 20), color='blue')
+    g.add_life_event('Event 3', datetime.date(2012, 8, 20), color='green', color_square=False)
+    g.draw()
+
+    scatters = [c for c in ax.collections if isinstance(c, PathCollection)]
+    assert [len(c.get_offsets()) for c in scatters] == [3, 2]
 
 def test_lifegraph_axes_multiple_subplots(tmp_path):
     """Test that Lifegraph can be used with multiple subplots"""
     birthdate1 = datetime.date(1990, 1, 1)
     birthdate2 = datetime.date(1995, 6, 15)
     
-    # Create a figure with multiple subplots
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 8))
+    # Create a figure with multiple subplots, outside of pyplot's figure manager
+    from matplotlib.figure import Figure
+    fig = Figure(figsize=(16, 8))
+    ax1, ax2 = fig.subplots(1, 2)
     
     # Create two Lifegraphs, each on a different axes
     g1 = Lifegraph(birthdate1, max_age=50, ax=ax1)
@@ -167,14 +283,11 @@ def test_lifegraph_axes_multiple_subplots(tmp_path):
     g1.add_life_event('Person 1 Event', datetime.date(2010, 1, 1), color='red')
     g2.add_life_event('Person 2 Event', datetime.date(2015, 1, 1), color='blue')
     
-    # Draw both by calling save on each (or we could call a draw method if it were public)
+    # Draw both graphs onto the shared figure, then write it once
+    g1.draw()
+    g2.draw()
     output_file = tmp_path / "test_multiple.png"
-    print("Saving to", output_file)
-    # We need to trigger drawing on both before saving
-    # Since save calls __draw internally, we call save on both
-    # But only need to actually write the file once
-    g1.save(str(output_file))
-    g2.save(str(output_file))  # This will save the same figure again, which is fine
+    fig.savefig(str(output_file))
     
     # Verify both axes have content
     assert len(ax1.lines) > 0
@@ -182,16 +295,13 @@ def test_lifegraph_axes_multiple_subplots(tmp_path):
     
     # Verify the file was created
     assert output_file.exists()
-    
-    # Clean up
-    plt.close(fig)
 
-def test_papersize_dimensions():
+@pytest.mark.parametrize("sz", list(Papersize), ids=[p.name for p in Papersize])
+def test_papersize_dimensions(sz):
     """Each Papersize member should have a 2-tuple of positive floats."""
-    for sz in Papersize:
-        w, h = sz.value
-        assert isinstance(w, (int, float)) and w > 0, f"{sz.name} width"
-        assert isinstance(h, (int, float)) and h > 0, f"{sz.name} height"
+    w, h = sz.value
+    assert isinstance(w, (int, float)) and w > 0, f"{sz.name} width"
+    assert isinstance(h, (int, float)) and h > 0, f"{sz.name} height"
 
 def test_lifegraph_params_scaling():
     """Computed params should produce sane values for a few sizes."""
@@ -219,13 +329,13 @@ def test_style_file_exists():
     assert "axes.labelcolor" in rc
     assert "lines.marker" in rc
 
-def test_all_papersizes_construct():
+@pytest.mark.parametrize("sz", list(Papersize), ids=[p.name for p in Papersize])
+def test_all_papersizes_construct(sz):
     """LifegraphParams should succeed for every Papersize member."""
-    for sz in Papersize:
-        params = LifegraphParams(sz)
-        assert params.size is sz
-        assert "figure.figsize" in params.rcParams
-        assert "watermark.fontsize" in params.otherParams
+    params = LifegraphParams(sz)
+    assert params.size is sz
+    assert "figure.figsize" in params.rcParams
+    assert "watermark.fontsize" in params.otherParams
 
 def test_validate_date():
     """Dates outside [birthdate, birthdate + max_age] should raise ValueError."""
@@ -321,6 +431,18 @@ def test_add_image():
     assert g.image_name == "/some/path.png"
     assert g.image_alpha == 0.5
 
+def test_add_image_array():
+    """add_image should accept an already decoded image array."""
+    import numpy as np
+    g = Lifegraph(datetime.date(1990, 1, 1), dpi=100, max_age=50)
+    img = np.zeros((4, 4, 3))
+    g.add_image(img, alpha=0.5)
+    assert g.image_name is None
+    assert g.image_data is img
+    g.draw()
+    assert len(g.ax.images) == 1
+    g.close()
+
 def test_add_era():
     """add_era should append to the eras list."""
     g = Lifegraph(datetime.date(1990, 1, 1), dpi=100, max_age=80)
@@ -435,23 +557,87 @@ def test_add_life_event_stores_annotation():
     g.add_life_event("Moved", datetime.date(2015, 3, 1), color="blue", side=Side.RIGHT)
     assert len(g.annotations) == 2
 
-def test_resolve_annotation_conflicts(tmp_path):
+def test_add_life_events_matches_add_life_event():
+    """The bulk method should produce the same annotations as single calls."""
+    birthday = datetime.date(2000, 2, 29)
+    events = [
+        {"text": "Leap", "date": datetime.date(2001, 2, 28), "color": "red"},
+        {"text": "Day before", "date": datetime.date(2004, 2, 28), "color": "blue", "side": Side.LEFT},
+        {"text": "Later", "date": datetime.date(2030, 12, 31), "color": "green", "color_square": False},
+    ]
+    single = Lifegraph(birthday, dpi=100)
+    for ev in events:
+        single.add_life_event(**ev)
+    bulk = Lifegraph(birthday, dpi=100)
+    bulk.add_life_events(events)
+
+    assert bulk._event_records == single._event_records
+    for a, b in zip(bulk.annotations, single.annotations):
+        assert (a.event_point.x, a.event_point.y) == (b.event_point.x, b.event_point.y)
+        assert (a.x, a.y) == (b.x, b.y)
+        assert (a.marker is None) == (b.marker is None)
+
+def test_add_life_events_validates_before_adding():
+    """A bad date anywhere in the batch should leave the graph untouched."""
+    g = Lifegraph(datetime.date(1990, 1, 1), dpi=100, max_age=80)
+    with pytest.raises(ValueError):
+        g.add_life_events([
+            {"text": "Good", "date": datetime.date(2000, 1, 1)},
+            {"text": "Bad", "date": datetime.date(1980, 1, 1)},
+        ])
+    assert g.annotations == []
+
+def test_add_life_events_bad_hint_and_side_adds_nothing():
+    """A record giving both hint and side should leave the graph untouched."""
+    g = Lifegraph(datetime.date(1990, 1, 1), dpi=100, max_age=80)
+    g.add_life_event("Existing", datetime.date(1995, 1, 1), color="red")
+    with pytest.raises(ValueError, match="mutually exclusive"):
+        g.add_life_events([
+            {"text": "Good", "date": datetime.date(2000, 1, 1)},
+            {"text": "Bad", "date": datetime.date(2001, 1, 1), "hint": Point(10, 10), "side": Side.LEFT},
+        ])
+    assert [a.text for a in g.annotations] == ["Existing"]
+    assert [r["text"] for r in g._event_records] == ["Existing"]
+
+def test_to_date_positions_matches_scalar():
+    """The vectorized conversion should agree with the relativedelta version."""
+    for birthday in (datetime.date(2000, 2, 29), datetime.date(1990, 1, 31), datetime.date(1965, 12, 31)):
+        g = Lifegraph(birthday, dpi=100)
+        dates = [birthday + datetime.timedelta(days=k) for k in range(0, 90 * 365, 13)]
+        batch = g._Lifegraph__to_date_positions(dates)
+        for date, pos in zip(dates, batch):
+            expected = g._Lifegraph__to_date_position(date)
+            assert (pos.x, pos.y) == (expected.x, expected.y)
+
+def test_date_to_xy_matches_relativedelta():
+    """The cached scalar conversion should match relativedelta anniversaries."""
+    from dateutil.relativedelta import relativedelta
+    from lifegraph.lifegraph import _date_to_xy
+    for birthday in (datetime.date(2000, 2, 29), datetime.date(1990, 1, 31)):
+        for k in range(0, 30 * 365, 11):
+            date = birthday + datetime.timedelta(days=k)
+            year = relativedelta(date, birthday).years
+            week = (date - (birthday + relativedelta(years=year))).days // 7
+            assert _date_to_xy(birthday, date, 52) == (week % 52 + 1, year)
+    hits = _date_to_xy.cache_info().hits
+    _date_to_xy(datetime.date(1990, 1, 31), datetime.date(1990, 1, 31), 52)
+    assert _date_to_xy.cache_info().hits == hits + 1
+
+def test_resolve_annotation_conflicts():
     """Overlapping annotations should be separated by the layout engine."""
     fig, ax = plt.subplots()
     g = Lifegraph(datetime.date(1990, 1, 1), dpi=100, max_age=80, ax=ax)
 
     # Add several events on the same date to force overlaps
-    for i in range(5):
-        g.add_life_event(f"Event {i}", datetime.date(2000, 1, 1), color="red")
+    g.add_life_events([{"text": f"Event {i}", "date": datetime.date(2000, 1, 1), "color": "red"}
+                       for i in range(5)])
 
     # Drawing triggers conflict resolution
-    g.save(str(tmp_path / "conflicts.png"))
+    g.draw()
 
     # All annotations should still be present
     assert len(ax.texts) >= 5
 
-    plt.close(fig)
-
 def test_lifegraph_init_min_age():
     """min_age should be stored and ymin computed correctly."""
     birthdate = datetime.date(1990, 1, 1)
@@ -483,7 +669,7 @@ def test_lifegraph_min_age_validation():
 def test_lifegraph_min_age_events_accepted_but_not_drawn(tmp_path):
     """Events outside the visible range should be stored but render succeeds."""
     birthdate = datetime.date(1990, 1, 1)
-    g = Lifegraph(birthdate, dpi=100, max_age=65, min_age=20)
+    g = Lifegraph(birthdate, dpi=50, max_age=65, min_age=20)
     # Event at age ~5, outside visible range
     g.add_life_event("Childhood event", datetime.date(1995, 6, 1), color="red")
     # Event at age ~30, inside visible range
@@ -495,10 +681,43 @@ def test_lifegraph_min_age_events_accepted_but_not_drawn(tmp_path):
     g.close()
 
 
+def test_visible_annotations_mask():
+    """Only annotations whose source rows reach [min_age, max_age) are laid out."""
+    g = Lifegraph(datetime.date(1990, 1, 1), dpi=100, max_age=65, min_age=20)
+    g.add_life_event("Too early", datetime.date(1995, 6, 1), color="red")
+    g.add_era("Crossing", datetime.date(2005, 1, 1), datetime.date(2015, 1, 1), color="blue")
+    g.add_life_event("Inside", datetime.date(2020, 6, 1), color="green")
+    visible = g._Lifegraph__visible_annotations()
+    assert [a.text for a in visible] == ["Crossing", "Inside"]
+    # annotations added after a call are picked up by the next one
+    g.add_life_event("Later", datetime.date(2030, 6, 1), color="black")
+    visible = g._Lifegraph__visible_annotations()
+    assert [a.text for a in visible] == ["Crossing", "Inside", "Later"]
+
+
+def test_visible_annotations_after_removal(tmp_path):
+    """Removing annotations after a draw should not misalign their visibility."""
+    g = Lifegraph(datetime.date(1990, 1, 1), dpi=50, max_age=65, min_age=20)
+    g.add_life_event("early", datetime.date(1995, 6, 1), color="red")
+    g.add_life_event("late", datetime.date(2020, 6, 1), color="green")
+    g.save(str(tmp_path / "a.png"))
+
+    g.annotations.pop(0)
+    g.add_life_event("early2", datetime.date(1996, 6, 1), color="red")
+    assert [a.text for a in g._Lifegraph__visible_annotations()] == ["late"]
+
+    del g.annotations[0]
+    g.invalidate()
+    g.save(str(tmp_path / "b.png"))
+    # only the invisible "early2" is left, so no event label is drawn
+    assert not {"early2", "late"} & {t.get_text() for t in g.ax.texts}
+    g.close()
+
+
 def test_lifegraph_min_age_eras_clipped(tmp_path):
     """Eras crossing the min_age boundary should be clipped; fully-outside skipped."""
     birthdate = datetime.date(1990, 1, 1)
-    g = Lifegraph(birthdate, dpi=100, max_age=65, min_age=20)
+    g = Lifegraph(birthdate, dpi=50, max_age=65, min_age=20)
     # Era entirely below min_age (ages 5-15)
     g.add_era("Childhood", datetime.date(1995, 1, 1), datetime.date(2005, 1, 1), color="red")
     # Era crossing boundary (ages 15-25)
@@ -512,10 +731,84 @@ def test_lifegraph_min_age_eras_clipped(tmp_path):
     g.close()
 
 
+def test_eras_drawn_as_one_collection():
+    """All visible era rows should end up as rectangles of a single collection."""
+    from matplotlib.collections import PolyCollection
+    birthdate = datetime.date(1990, 1, 1)
+    fig, ax = plt.subplots()
+    g = Lifegraph(birthdate, dpi=100, max_age=65, min_age=20, ax=ax)
+    g.add_era("Childhood", datetime.date(1995, 1, 1), datetime.date(2005, 1, 1), color="red")
+    g.add_era("Transition", datetime.date(2005, 1, 1), datetime.date(2015, 1, 1), color="blue")
+    g.add_era("Career", datetime.date(2015, 1, 1), datetime.date(2025, 1, 1), color="green", alpha=0.5)
+    g.draw()
+
+    eras = [c for c in ax.collections if isinstance(c, PolyCollection)]
+    assert len(eras) == 1
+    # ages 20-25 of the transition plus ages 25-35 of the career
+    assert len(eras[0].get_paths()) == 6 + 11
+    assert eras[0].get_facecolors()[-1][3] == pytest.approx(0.5)
+
+
+def test_x_to_axes_matches_trans_limits():
+    """The closed-form x conversion used for eras should agree with matplotlib."""
+    fig, ax = plt.subplots()
+    g = Lifegraph(datetime.date(1990, 1, 1), dpi=100, max_age=65, ax=ax)
+    g.draw()
+    for x in (-0.5, 0.5, 10.5, 26, 52.5):
+        expected = ax.transLimits.transform((x, 0))[0]
+        assert g._Lifegraph__x_to_axes(x) == pytest.approx(expected)
+
+
+def test_era_spans_drawn_as_collections():
+    """Visible era spans should share one circle collection and one bar collection."""
+    from matplotlib.collections import EllipseCollection, LineCollection
+    birthdate = datetime.date(1990, 1, 1)
+    fig, ax = plt.subplots()
+    g = Lifegraph(birthdate, dpi=100, max_age=65, min_age=20, ax=ax)
+    g.add_era_span("Early", datetime.date(1995, 1, 1), datetime.date(1998, 1, 1), color="red")
+    g.add_era_span("Later", datetime.date(2015, 1, 1), datetime.date(2020, 1, 1), color="blue")
+    g.add_era_span("Trip", datetime.date(2021, 6, 1), datetime.date(2021, 9, 1), color="green")
+    g.draw()
+
+    circles = [c for c in ax.collections if isinstance(c, EllipseCollection)]
+    bars = [c for c in ax.collections if isinstance(c, LineCollection)]
+    assert len(circles) == 1 and len(circles[0].get_offsets()) == 4
+    assert len(bars) == 1 and len(bars[0].get_segments()) == 2
+
+
+def test_era_span_markers_batched():
+    """Colored start and end squares of all spans should share one scatter."""
+    from matplotlib.collections import PathCollection
+    fig, ax = plt.subplots()
+    g = Lifegraph(datetime.date(1990, 1, 1), dpi=100, max_age=50, ax=ax)
+    g.add_era_span("A", datetime.date(2000, 1, 1), datetime.date(2002, 1, 1), color="red",
+                   color_start_and_end_markers=True)
+    g.add_era_span("B", datetime.date(2010, 1, 1), datetime.date(2012, 1, 1), color="blue",
+                   color_start_and_end_markers=True)
+    g.draw()
+    assert len(ax.lines) == 1
+    squares = [c for c in ax.collections if isinstance(c, PathCollection) and len(c.get_offsets()) == 4]
+    assert len(squares) == 1
+
+
+def test_era_span_marker_edge_color():
+    """Span start and end squares keep the style's black outline, not the era color."""
+    import matplotlib.colors as mcolors
+    from matplotlib.collections import PathCollection
+    fig, ax = plt.subplots()
+    g = Lifegraph(datetime.date(1990, 1, 1), dpi=100, max_age=50, ax=ax)
+    g.add_era_span("A", datetime.date(2000, 1, 1), datetime.date(2002, 1, 1), color="red",
+                   color_start_and_end_markers=True)
+    g.draw()
+    squares = [c for c in ax.collections if isinstance(c, PathCollection) and len(c.get_offsets()) == 2]
+    assert len(squares) == 1
+    assert (squares[0].get_edgecolors() == mcolors.to_rgba_array(["black"])).all()
+
+
 def test_lifegraph_min_age_era_spans_filtered(tmp_path):
     """Era spans entirely outside the visible range should be skipped."""
     birthdate = datetime.date(1990, 1, 1)
-    g = Lifegraph(birthdate, dpi=100, max_age=65, min_age=20)
+    g = Lifegraph(birthdate, dpi=50, max_age=65, min_age=20)
     # Span entirely below min_age
     g.add_era_span("Early", datetime.date(1995, 1, 1), datetime.date(1998, 1, 1), color="red")
     # Span in range
@@ -530,7 +823,7 @@ def test_lifegraph_min_age_era_spans_filtered(tmp_path):
 def test_lifegraph_min_age_render_full(tmp_path):
     """Full render with all features + min_age should succeed."""
     birthdate = datetime.date(1990, 1, 1)
-    g = Lifegraph(birthdate, dpi=100, max_age=65, min_age=20)
+    g = Lifegraph(birthdate, dpi=50, max_age=65, min_age=20)
     g.add_title("Ages 20-65")
     g.add_watermark("TEST")
     g.show_max_age_label()
@@ -545,6 +838,20 @@ def test_lifegraph_min_age_render_full(tmp_path):
     g.close()
 
 
+def test_label_layout_matches_window_extent():
+    """Cached label boxes should equal the window extent of the same text artist."""
+    from lifegraph.lifegraph import _label_layout, _label_layouts_for
+    fig, ax = plt.subplots(dpi=100)
+    renderer = fig.canvas.get_renderer()
+    for text in ("Job", "Started working at\nEcosia"):
+        t = ax.text(10, 20, text, ha='left', va='center', weight='bold')
+        x, y = ax.transData.transform((10, 20))
+        layout = _label_layout(text, fig, renderer)
+        assert _label_layout(text, fig, renderer) is layout
+        assert layout.translated(x, y).bounds == t.get_window_extent(renderer=renderer).bounds
+        assert _label_layouts_for([text, text], fig, renderer) == [layout, layout]
+
+
 def test_annotation_bbox_uses_bold_weight(tmp_path):
     """Annotations measured with bold weight should not overlap when min_age is set.
 
@@ -596,8 +903,6 @@ def test_annotation_bbox_uses_bold_weight(tmp_path):
         f"min={min_gap:.1f}px (20% of {text_height:.1f}px text height)"
     )
 
-    plt.close(fig)
-
 
 if __name__ == "__main__":
     pytest.main()
\ No newline at end of file
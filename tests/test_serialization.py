@@ -77,6 +77,50 @@ def test_json_roundtrip_full(tmp_path):
     assert len(g2._era_span_records) == 1
 
 
+# ---------------------------------------------------------------------------
+# In-memory dict round-trip
+# ---------------------------------------------------------------------------
+
+def test_dict_roundtrip(tmp_path):
+    g = Lifegraph(datetime.date(1995, 11, 20), dpi=100, max_age=80)
+    g.add_life_event("Moved", datetime.date(2015, 3, 1), "blue", side=Side.LEFT)
+    g.add_era("College", datetime.date(2014, 9, 1), datetime.date(2018, 12, 14), "red")
+    g.format_x_axis(text="Weeks")
+
+    d = g.to_dict(include_styling=True)
+    path = tmp_path / "dict.json"
+    g.save_config(str(path), include_styling=True)
+    assert json.loads(path.read_bytes()) == d
+
+    g2 = Lifegraph.from_dict(d)
+    assert g2.birthdate == datetime.date(1995, 11, 20)
+    assert g2.xaxis_label == "Weeks"
+    assert g2.to_dict(include_styling=True) == d
+
+
+def test_ordinal_dates_roundtrip(tmp_path):
+    g = Lifegraph(datetime.date(1995, 11, 20), dpi=100, max_age=80)
+    g.add_life_event("Moved", datetime.date(2015, 3, 1), "blue")
+    g.add_era("College", datetime.date(2014, 9, 1), datetime.date(2018, 12, 14), "red")
+    g.add_era_span("Trip", datetime.date(2016, 6, 1), datetime.date(2016, 8, 1), "green")
+
+    path = tmp_path / "ordinal.json"
+    g.save_config(str(path), date_format="ordinal")
+    d = json.loads(path.read_bytes())
+    assert d["date_format"] == "ordinal"
+    assert d["birthdate"] == datetime.date(1995, 11, 20).toordinal()
+    assert d["events"][0]["date"] == datetime.date(2015, 3, 1).toordinal()
+
+    g2 = Lifegraph.from_config(str(path))
+    assert g2.to_dict() == g.to_dict()
+
+
+def test_unsupported_date_format():
+    g = Lifegraph(datetime.date(1995, 11, 20), dpi=100)
+    with pytest.raises(ValueError, match="date_format"):
+        g.to_dict(date_format="epoch")
+
+
 # ---------------------------------------------------------------------------
 # Color round-trip
 # ---------------------------------------------------------------------------
@@ -106,7 +150,7 @@ def test_hint_roundtrip(tmp_path):
     path = tmp_path / "hints.json"
     g.save_config(str(path))
 
-    raw = json.loads(path.read_text())
+    raw = json.loads(path.read_bytes())
     assert raw["events"][0]["hint"] == [25, -3]
 
     g2 = Lifegraph.from_config(str(path))
@@ -128,7 +172,7 @@ def test_side_roundtrip(tmp_path):
     path = tmp_path / "sides.json"
     g.save_config(str(path))
 
-    raw = json.loads(path.read_text())
+    raw = json.loads(path.read_bytes())
     assert raw["events"][0]["side"] == "left"
     assert raw["events"][1]["side"] == "right"
 
@@ -187,7 +231,7 @@ def test_styling_not_included(tmp_path):
     path = tmp_path / "no_style.json"
     g.save_config(str(path), include_styling=False)
 
-    raw = json.loads(path.read_text())
+    raw = json.loads(path.read_bytes())
     assert "styling" not in raw
 
 
@@ -223,7 +267,7 @@ def test_defaults_omitted(tmp_path):
     path = tmp_path / "defaults.json"
     g.save_config(str(path))
 
-    raw = json.loads(path.read_text())
+    raw = json.loads(path.read_bytes())
 
     # Constructor defaults omitted
     assert "max_age" not in raw
@@ -289,7 +333,7 @@ def test_unsupported_version(tmp_path):
 # ---------------------------------------------------------------------------
 
 def test_render_after_import(tmp_path):
-    g = Lifegraph(datetime.date(1995, 11, 20), dpi=100, size=Papersize.Letter, max_age=50)
+    g = Lifegraph(datetime.date(1995, 11, 20), dpi=50, size=Papersize.Letter, max_age=50)
     g.add_life_event("Won award", datetime.date(2013, 11, 20), "#014421")
     g.add_era("College", datetime.date(2014, 9, 1), datetime.date(2018, 12, 14), "blue")
     g.add_era_span("Vacation", datetime.date(2016, 8, 22), datetime.date(2016, 12, 16), "#D2691E")
@@ -319,7 +363,7 @@ def test_min_age_roundtrip(tmp_path):
     path = tmp_path / "min_age.json"
     g.save_config(str(path))
 
-    raw = json.loads(path.read_text())
+    raw = json.loads(path.read_bytes())
     assert raw["min_age"] == 20
 
     g2 = Lifegraph.from_config(str(path))
@@ -334,7 +378,7 @@ def test_min_age_default_omitted(tmp_path):
     path = tmp_path / "no_min_age.json"
     g.save_config(str(path))
 
-    raw = json.loads(path.read_text())
+    raw = json.loads(path.read_bytes())
     assert "min_age" not in raw
 
 